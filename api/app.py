@@ -5,8 +5,6 @@ Production-hardened with error handling, CORS, file validation, and health check
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from pathlib import Path
-import tempfile
-import os
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -132,23 +130,23 @@ def screen_resume():
     if not job_description or len(job_description.strip()) < 20:
         return jsonify({'error': 'Job description is too short (minimum 20 characters)'}), 400
     
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-        resume_file.save(tmp.name)
-        tmp_path = tmp.name
+    # Screen straight from the upload bytes; the resume cache is skipped
+    # unless API_RESUME_CACHE_ENABLED is set, so uploads are not kept on disk
+    pdf_bytes = resume_file.read()
     
     try:
+        from config.settings import API_RESUME_CACHE_ENABLED
         from pipeline.screening_pipeline import ScreeningPipeline
         
         pipeline = ScreeningPipeline()
-        result = pipeline.screen_resume(tmp_path, job_description, job_title)
+        result = pipeline.screen_resume_bytes(
+            pdf_bytes, job_description, job_title, filename=resume_file.filename,
+            use_cache=API_RESUME_CACHE_ENABLED
+        )
         
         return jsonify(result)
     except Exception as e:
         return jsonify({'error': f'Screening failed: {str(e)}'}), 500
-    finally:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
 
 
 @app.route('/api/extract', methods=['POST'])
@@ -164,19 +162,14 @@ def extract_text():
     if not is_valid:
         return jsonify({'error': error_msg}), 400
     
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-        resume_file.save(tmp.name)
-        tmp_path = tmp.name
+    pdf_bytes = resume_file.read()
     
     try:
-        from src.preprocessing import extract_text_from_pdf
-        result = extract_text_from_pdf(tmp_path)
+        from src.preprocessing import extract_text_from_pdf_bytes
+        result = extract_text_from_pdf_bytes(pdf_bytes)
         return jsonify(result)
     except Exception as e:
         return jsonify({'error': f'Text extraction failed: {str(e)}'}), 500
-    finally:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
 
 
 @app.route('/api/skills', methods=['POST'])
@@ -36,13 +36,29 @@ MAX_EXTRACTED_TEXT_LENGTH = 50000
 SUPPORTED_PDF_VERSIONS = ["1.4", "1.5", "1.6", "1.7"]
 PROCESSING_TIMEOUT_SECONDS = 60
 
+# Batch Processing
+BATCH_MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", str(os.cpu_count() or 1)))
+
+# Processed resumes cached on disk by PDF content hash
+RESUME_CACHE_DIR = PROCESSED_DATA_DIR / "resume_cache"
+RESUME_CACHE_ENABLED = os.getenv("RESUME_CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
+# Entries hold candidate PII, so the cache is bounded in both size and age
+RESUME_CACHE_MAX_ENTRIES = int(os.getenv("RESUME_CACHE_MAX_ENTRIES", "500"))
+RESUME_CACHE_MAX_AGE_HOURS = float(os.getenv("RESUME_CACHE_MAX_AGE_HOURS", "24"))
+# The REST API only persists uploads to the cache when explicitly enabled
+API_RESUME_CACHE_ENABLED = os.getenv("API_RESUME_CACHE_ENABLED", "false").lower() in ("true", "1", "yes")
+
 # Text Processing
 TEXT_ENCODING = "utf-8"
 MIN_TEXT_LENGTH = 100
 
+# Decode learning resources per skill on demand instead of loading the whole catalog
+RESOURCES_LAZY = os.getenv("RESOURCES_LAZY", "false").lower() in ("true", "1", "yes")
+
 # NLP Settings
 SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_md")
 VECTOR_DIMENSIONALITY = 300
+VECTOR_DTYPE = "float32"
 MIN_SKILL_CONFIDENCE = 0.7
 
 # Scoring Weights
@@ -4,18 +4,24 @@ Main orchestration for resume screening workflow.
 """
 import os
 import sys
+import uuid
+from dataclasses import replace
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List, Tuple
+
+import numpy as np
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.settings import SKILLS_TAXONOMY_PATH
 from config.logging_config import get_logger
-from src.preprocessing import extract_text_from_pdf, clean_text, parse_resume_info
-from src.feature_engineering import extract_skills, create_document_vector
+from src.preprocessing import extract_text_from_pdf, extract_text_from_pdf_bytes, clean_text, parse_resume_info
+from src.feature_engineering import extract_skills, create_document_vector, create_document_vectors
 from src.matching import calculate_match_score, generate_match_explanation
 from src.models import Resume, JobDescription, MatchResult
+from src.utils.resume_cache import content_key, load_resume, store_resume
 
 logger = get_logger("pipeline")
 
@@ -47,10 +53,106 @@ class ScreeningPipeline:
         Returns:
             Processed Resume object
         """
+        resume = self.extract_resume(pdf_path)
+        resume.vector_representation = create_document_vector(resume.extracted_text)
+        return resume
+    
+    def process_resume_bytes(
+        self,
+        data: bytes,
+        filename: str = "resume.pdf",
+        use_cache: bool = True
+    ) -> Resume:
+        """
+        Process in-memory PDF bytes, reusing a cached result for identical files.
+        
+        Args:
+            data: Raw PDF bytes
+            filename: Original file name, recorded as the resume's source
+            use_cache: Read and write the on-disk resume cache; pass False
+                when uploads must not be persisted
+            
+        Returns:
+            Processed Resume object with a fresh resume_id
+        """
+        if use_cache:
+            cached = self.load_cached_resume(data, filename)
+            if cached is not None:
+                return cached
+        
+        resume = self.extract_resume_bytes(data, filename)
+        resume.vector_representation = create_document_vector(resume.extracted_text)
+        if use_cache:
+            self.cache_resume(data, resume)
+        return resume
+    
+    def load_cached_resume(self, data: bytes, filename: str = "resume.pdf") -> Optional[Resume]:
+        """
+        Look up a processed resume for these PDF bytes in the resume cache.
+        
+        Args:
+            data: Raw PDF bytes
+            filename: Original file name, recorded as the resume's source
+            
+        Returns:
+            Copy of the cached Resume with a fresh resume_id, or None on a miss
+        """
+        cached = load_resume(content_key(data))
+        if cached is None:
+            return None
+        
+        logger.info(f"Resume cache hit: {filename}")
+        return replace(
+            cached,
+            resume_id=str(uuid.uuid4()),
+            timestamp=datetime.utcnow().isoformat(),
+            source_file=filename
+        )
+    
+    def cache_resume(self, data: bytes, resume: Resume) -> None:
+        """
+        Store a vectorized resume in the resume cache under its PDF bytes.
+        
+        Args:
+            data: Raw PDF bytes the resume was extracted from
+            resume: Processed Resume object
+        """
+        store_resume(content_key(data), resume)
+    
+    def extract_resume(self, pdf_path: str) -> Resume:
+        """
+        Extract text, contact info and skills from a resume PDF.
+        
+        The vector representation is left unset so that several resumes
+        can be vectorized together with vectorize_resumes().
+        
+        Args:
+            pdf_path: Path to resume PDF
+            
+        Returns:
+            Resume object without vector representation
+        """
         logger.info(f"Processing resume: {pdf_path}")
         
         # Extract text
-        extraction_result = extract_text_from_pdf(pdf_path)
+        return self._build_resume(extract_text_from_pdf(pdf_path), pdf_path)
+    
+    def extract_resume_bytes(self, data: bytes, filename: str = "resume.pdf") -> Resume:
+        """
+        Extract a resume from in-memory PDF bytes, e.g. a Streamlit upload.
+        
+        Args:
+            data: Raw PDF bytes
+            filename: Original file name, recorded as the resume's source
+            
+        Returns:
+            Resume object without vector representation
+        """
+        logger.info(f"Processing uploaded resume: {filename}")
+        return self._build_resume(extract_text_from_pdf_bytes(data), filename)
+    
+    def _build_resume(self, extraction_result: Dict[str, Any], source_file: str) -> Resume:
+        """Clean, parse and extract skills from a PDF extraction result."""
         raw_text = extraction_result['text']
         
         # Clean text
@@ -62,9 +164,6 @@ class ScreeningPipeline:
         # Extract skills
         skills = extract_skills(cleaned_text, self.skills_taxonomy)
         
-        # Create vector
-        vector = create_document_vector(cleaned_text)
-        
         # Build Resume object
         resume = Resume(
             name=parsed_info.get('name', 'Unknown'),
@@ -72,21 +171,36 @@ class ScreeningPipeline:
             phone=parsed_info.get('phone'),
             extracted_text=cleaned_text,
             skills=skills,
-            vector_representation=vector,
             extraction_method=extraction_result['extraction_method'],
             num_pages=extraction_result['num_pages'],
             file_size_bytes=extraction_result['file_size_bytes'],
-            source_file=pdf_path
+            source_file=source_file
         )
         
         logger.info(f"Resume processed: {resume.name}, {len(skills)} skills extracted")
         return resume
     
+    def vectorize_resumes(self, resumes: List[Resume]) -> None:
+        """
+        Compute vector representations for several resumes in one batch.
+        
+        Args:
+            resumes: Resume objects, updated in place
+        """
+        if not resumes:
+            return
+        
+        vectors = create_document_vectors([r.extracted_text for r in resumes])
+        for resume, vector in zip(resumes, vectors):
+            resume.vector_representation = vector
+    
     def process_job_description(
         self,
         text: str,
         title: str = "Job Position",
-        required_skills: Optional[List[Dict]] = None
+        required_skills: Optional[List[Dict]] = None,
+        company: Optional[str] = None,
+        vector: Optional[np.ndarray] = None
     ) -> JobDescription:
         """
         Process a job description.
@@ -95,6 +209,9 @@ class ScreeningPipeline:
             text: Job description text
             title: Job title
             required_skills: List of required skills with importance
+            company: Hiring company, if known
+            vector: Document vector already computed for text, e.g. by a
+                batched create_document_vectors call
             
         Returns:
             Processed JobDescription object
@@ -102,7 +219,8 @@ class ScreeningPipeline:
         logger.info(f"Processing job description: {title}")
         
         # Create vector
-        vector = create_document_vector(text)
+        if vector is None:
+            vector = create_document_vector(text)
         
         # Extract skills if not provided
         if required_skills is None:
@@ -114,6 +232,7 @@ class ScreeningPipeline:
         
         job = JobDescription(
             title=title,
+            company=company,
             description=text,
             required_skills=required_skills,
             vector_representation=vector
@@ -122,10 +241,37 @@ class ScreeningPipeline:
         logger.info(f"Job processed: {len(required_skills)} required skills")
         return job
     
+    def process_job_descriptions(self, jobs: List[Dict]) -> List[JobDescription]:
+        """
+        Process several job descriptions, vectorizing them in one batch.
+        
+        Args:
+            jobs: Job dicts with 'title' and 'description'
+            
+        Returns:
+            Processed JobDescription objects, in input order
+        """
+        texts = [job.get('description', job.get('raw_text', '')) for job in jobs]
+        vectors = create_document_vectors(texts)
+        
+        processed = [
+            self.process_job_description(
+                text,
+                job.get('title', 'Job Position'),
+                company=job.get('company'),
+                vector=vector
+            )
+            for job, text, vector in zip(jobs, texts, vectors)
+        ]
+        
+        logger.info(f"Processed {len(processed)} job descriptions")
+        return processed
+    
     def match_resume_to_job(
         self,
         resume,
-        job
+        job,
+        semantic_similarity: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Match a resume against a job description.
@@ -133,6 +279,8 @@ class ScreeningPipeline:
         Args:
             resume: Processed Resume object or dict
             job: Processed JobDescription object or dict
+            semantic_similarity: Optional vector similarity already computed
+                for this pair, e.g. in a multi-job batch
             
         Returns:
             Match result dictionary with explanation
@@ -184,7 +332,8 @@ class ScreeningPipeline:
             resume_skills=resume_skill_names,
             required_skills=required_skills,
             resume_text=resume_text,
-            job_text=job_text
+            job_text=job_text,
+            semantic_similarity=semantic_similarity
         )
         
         # Add IDs
@@ -197,11 +346,73 @@ class ScreeningPipeline:
         logger.info(f"Match score: {result['overall_score']:.2f} ({result['recommendation']})")
         return result
 
+    def screen_resume_bytes(
+        self,
+        data: bytes,
+        job_text: str,
+        job_title: str = "Job Position",
+        filename: str = "resume.pdf",
+        job: Optional[JobDescription] = None,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        End-to-end screening of an in-memory PDF, without a temp file.
+        
+        Args:
+            data: Raw resume PDF bytes
+            job_text: Job description text
+            job_title: Job title
+            filename: Original file name of the upload
+            job: Already processed job description to reuse across a batch
+            use_cache: Read and write the on-disk resume cache
+            
+        Returns:
+            Complete screening result, as from screen_resume
+        """
+        stages = self.screen_resume_bytes_streaming(data, job_text, job_title, filename, job, use_cache)
+        for _, payload in stages:
+            pass
+        return payload
+    
+    def screen_resume_bytes_streaming(
+        self,
+        data: bytes,
+        job_text: str,
+        job_title: str = "Job Position",
+        filename: str = "resume.pdf",
+        job: Optional[JobDescription] = None,
+        use_cache: bool = True
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Screen an in-memory PDF stage by stage, so callers can show progress.
+        
+        Args:
+            data: Raw resume PDF bytes
+            job_text: Job description text
+            job_title: Job title
+            filename: Original file name of the upload
+            job: Already processed job description to reuse across a batch
+            use_cache: Read and write the on-disk resume cache
+            
+        Yields:
+            ('resume', Resume), then ('job', JobDescription), then
+            ('result', screening result as from screen_resume)
+        """
+        resume = self.process_resume_bytes(data, filename, use_cache)
+        yield 'resume', resume
+        
+        if job is None:
+            job = self.process_job_description(job_text, job_title)
+        yield 'job', job
+        
+        yield 'result', self._screen(resume, job_text, job_title, job)
+    
     def screen_resume(
         self,
         pdf_path: str,
         job_text: str,
-        job_title: str = "Job Position"
+        job_title: str = "Job Position",
+        job: Optional[JobDescription] = None
     ) -> Dict[str, Any]:
         """
         End-to-end screening: process resume, job, and return match.
@@ -210,13 +421,23 @@ class ScreeningPipeline:
             pdf_path: Path to resume PDF
             job_text: Job description text
             job_title: Job title
+            job: Already processed job description to reuse across a batch
             
         Returns:
             Complete screening result
         """
-        # Process inputs
-        resume = self.process_resume(pdf_path)
-        job = self.process_job_description(job_text, job_title)
+        return self._screen(self.process_resume(pdf_path), job_text, job_title, job)
+    
+    def _screen(
+        self,
+        resume: Resume,
+        job_text: str,
+        job_title: str,
+        job: Optional[JobDescription] = None
+    ) -> Dict[str, Any]:
+        """Match an already processed resume, processing the job only if not given."""
+        if job is None:
+            job = self.process_job_description(job_text, job_title)
         
         # Match
         match_result = self.match_resume_to_job(resume, job)
@@ -1,4 +1,4 @@
 """Feature Engineering module for skill extraction and vectorization."""
 from .skill_extractor import extract_skills
-from .vectorizer import create_document_vector
+from .vectorizer import create_document_vector, create_document_vectors
 from .keyword_analyzer import extract_keywords
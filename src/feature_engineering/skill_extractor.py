@@ -5,14 +5,18 @@ Uses skill_synonyms.json to normalize abbreviations and variants.
 """
 import json
 import re
+from importlib.util import find_spec
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+# spaCy is slow to import, so only probe for it here and import it on first use
+SPACY_AVAILABLE = find_spec("spacy") is not None
+
 try:
-    import spacy
-    SPACY_AVAILABLE = True
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    SPACY_AVAILABLE = False
+    AHOCORASICK_AVAILABLE = False
 
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
@@ -27,6 +31,9 @@ _nlp = None
 # Global synonym cache
 _synonyms = None
 
+# Matcher for the last synonyms dict seen: (synonyms, canonical names by rank, matcher)
+_synonym_matcher = None
+
 # Path to synonyms file
 SKILL_SYNONYMS_PATH = SKILLS_TAXONOMY_PATH.parent / "skill_synonyms.json"
 
@@ -39,6 +46,7 @@ def load_spacy_model():
             logger.warning("spaCy not installed")
             return None
         try:
+            import spacy
             _nlp = spacy.load(SPACY_MODEL)
             logger.info(f"Loaded spaCy model: {SPACY_MODEL}")
         except OSError:
@@ -92,18 +100,20 @@ def normalize_text_with_synonyms(text: str, synonyms: Optional[Dict[str, str]] =
     if not synonyms:
         return text
     
-    # Build a list of canonical skills found via synonyms
-    found_canonical = []
+    canonicals, matcher = _get_synonym_matcher(synonyms)
     text_lower = text.lower()
     
-    # Sort by length descending so longer patterns match first
-    # (e.g. "React.js" before "React")
-    sorted_synonyms = sorted(synonyms.items(), key=lambda x: len(x[0]), reverse=True)
+    if AHOCORASICK_AVAILABLE:
+        # Single pass over the text; keep hits that sit on word boundaries
+        ranks = set()
+        for end, (length, variant_ranks) in matcher.iter(text_lower):
+            if _is_word_boundary(text_lower, end - length + 1) and _is_word_boundary(text_lower, end + 1):
+                ranks.update(variant_ranks)
+    else:
+        ranks = {rank for rank, pattern in matcher if pattern.search(text_lower)}
     
-    for variant, canonical in sorted_synonyms:
-        pattern = rf'\b{re.escape(variant)}\b'
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            found_canonical.append(canonical)
+    # Report canonical names in longest-variant-first order
+    found_canonical = [canonicals[rank] for rank in sorted(ranks)]
     
     # Append canonical names to the text so regular taxonomy matching picks them up
     if found_canonical:
@@ -117,7 +127,12 @@ def load_skills_taxonomy() -> Dict[str, List[str]]:
     """Load skills taxonomy from JSON file."""
     if SKILLS_TAXONOMY_PATH.exists():
         with open(SKILLS_TAXONOMY_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            taxonomy = json.load(f)
+        # Intern names once so every extracted skill dict shares them
+        return {
+            sys.intern(category): [sys.intern(skill) for skill in skills]
+            for category, skills in taxonomy.items()
+        }
     
     # Default minimal taxonomy
     return {
@@ -144,6 +159,50 @@ def load_skills_taxonomy() -> Dict[str, List[str]]:
     }
 
 
+def _get_synonym_matcher(synonyms: Dict[str, str]) -> tuple:
+    """
+    Build (or reuse) the multi-pattern matcher for a synonyms dict.
+    
+    Variants are ranked longest first (e.g. "React.js" before "React").
+    With pyahocorasick the matcher is an automaton over the lowercased
+    variants; otherwise it is a list of precompiled word-boundary regexes.
+    
+    Returns:
+        Tuple of (canonical names indexed by rank, matcher)
+    """
+    global _synonym_matcher
+    if _synonym_matcher is not None and _synonym_matcher[0] is synonyms:
+        return _synonym_matcher[1], _synonym_matcher[2]
+    
+    ordered = sorted(synonyms.items(), key=lambda x: len(x[0]), reverse=True)
+    canonicals = [canonical for _, canonical in ordered]
+    
+    if AHOCORASICK_AVAILABLE:
+        matcher = ahocorasick.Automaton()
+        for rank, (variant, _) in enumerate(ordered):
+            key = variant.lower()
+            if key in matcher:
+                matcher.get(key)[1].append(rank)
+            else:
+                matcher.add_word(key, (len(key), [rank]))
+        matcher.make_automaton()
+    else:
+        matcher = [
+            (rank, re.compile(rf'\b{re.escape(variant)}\b', re.IGNORECASE))
+            for rank, (variant, _) in enumerate(ordered)
+        ]
+    
+    _synonym_matcher = (synonyms, canonicals, matcher)
+    return canonicals, matcher
+
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """Regex word-boundary check: word-ness differs on either side of index."""
+    before = index > 0 and (text[index - 1].isalnum() or text[index - 1] == '_')
+    after = index < len(text) and (text[index].isalnum() or text[index] == '_')
+    return before != after
+
+
 def extract_skills(
     text: str,
     skill_taxonomy: Optional[Dict] = None,
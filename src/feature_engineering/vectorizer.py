@@ -3,24 +3,18 @@ Vectorizer Module
 Generates TF-IDF or embedding-based vector representations.
 """
 import numpy as np
+from importlib.util import find_spec
 from typing import List, Optional, Union
 from pathlib import Path
 
-try:
-    import spacy
-    SPACY_AVAILABLE = True
-except ImportError:
-    SPACY_AVAILABLE = False
-
-try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
+# spaCy and scikit-learn are slow to import, so only probe for them here
+# and import them in the functions that use them
+SPACY_AVAILABLE = find_spec("spacy") is not None
+SKLEARN_AVAILABLE = find_spec("sklearn") is not None
 
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
-from config.settings import SPACY_MODEL, VECTOR_DIMENSIONALITY
+from config.settings import SPACY_MODEL, VECTOR_DIMENSIONALITY, VECTOR_DTYPE
 from config.logging_config import get_logger
 
 logger = get_logger("vectorizer")
@@ -37,6 +31,7 @@ def get_spacy_model():
             logger.warning("spaCy not available")
             return None
         try:
+            import spacy
             _nlp = spacy.load(SPACY_MODEL)
             logger.info(f"Successfully loaded {SPACY_MODEL}")
         except OSError:
@@ -62,7 +57,7 @@ def create_document_vector(
         NumPy array of shape (VECTOR_DIMENSIONALITY,)
     """
     if not text or not text.strip():
-        return np.zeros(VECTOR_DIMENSIONALITY)
+        return np.zeros(VECTOR_DIMENSIONALITY, dtype=VECTOR_DTYPE)
     
     if method == 'spacy':
         return create_spacy_vector(text)
@@ -72,6 +67,70 @@ def create_document_vector(
         raise ValueError(f"Unknown vectorization method: {method}")
 
 
+def create_document_vectors(
+    texts: List[str],
+    batch_size: int = 32
+) -> np.ndarray:
+    """
+    Create vector representations for several documents at once.
+    
+    Batches the texts through spaCy's nlp.pipe (or a single hashing
+    transform in the fallback path) instead of vectorizing one by one.
+    
+    Args:
+        texts: Document texts
+        batch_size: Number of documents per spaCy batch
+        
+    Returns:
+        NumPy array of shape (len(texts), VECTOR_DIMENSIONALITY)
+    """
+    vectors = np.zeros((len(texts), VECTOR_DIMENSIONALITY), dtype=VECTOR_DTYPE)
+    
+    # Empty documents keep their zero vector, as in create_document_vector
+    indices = [i for i, text in enumerate(texts) if text and text.strip()]
+    if not indices:
+        return vectors
+    batch_texts = [texts[i] for i in indices]
+    
+    nlp = get_spacy_model()
+    
+    if nlp is None:
+        logger.info("Using TF-IDF fallback for batch vectorization")
+        vectors[indices] = create_simple_tfidf_vectors(batch_texts)
+        return vectors
+    
+    for i, doc in zip(indices, _vector_docs(nlp, batch_texts, batch_size)):
+        vector = doc.vector
+        if vector.shape[0] != VECTOR_DIMENSIONALITY:
+            logger.warning(f"Vector dimension mismatch: {vector.shape[0]} != {VECTOR_DIMENSIONALITY}")
+            continue
+        vectors[i] = vector
+    
+    return vectors
+
+
+def _vector_docs(nlp, texts: List[str], batch_size: int = 32):
+    """
+    Yield spaCy docs with just enough processing for doc.vector.
+    
+    With static word vectors (the md/lg models) the document vector is the
+    average of token vectors, so tokenizing is all that is needed and the
+    tagger, parser and NER are skipped. Models without vectors fall back to
+    the full pipeline, whose tok2vec tensor backs doc.vector.
+    
+    Args:
+        nlp: Loaded spaCy model
+        texts: Document texts
+        batch_size: Number of documents per spaCy batch
+        
+    Returns:
+        Iterator of spaCy Doc objects, one per text
+    """
+    if nlp.vocab.vectors.shape[0]:
+        return map(nlp.make_doc, texts)
+    return nlp.pipe(texts, batch_size=batch_size)
+
+
 def create_spacy_vector(text: str) -> np.ndarray:
     """
     Create document vector using spaCy word embeddings, or fallback to simple TF-IDF.
@@ -89,10 +148,10 @@ def create_spacy_vector(text: str) -> np.ndarray:
         logger.info("Using TF-IDF fallback for vectorization")
         return create_simple_tfidf_vector(text)
     
-    doc = nlp(text)
+    doc = next(_vector_docs(nlp, [text]))
     
     # Get the document vector (average of word vectors)
-    vector = doc.vector
+    vector = doc.vector.astype(VECTOR_DTYPE, copy=False)
     
     if vector.shape[0] != VECTOR_DIMENSIONALITY:
         logger.warning(f"Vector dimension mismatch: {vector.shape[0]} != {VECTOR_DIMENSIONALITY}")
@@ -113,7 +172,7 @@ def create_simple_tfidf_vector(text: str) -> np.ndarray:
     """
     if not SKLEARN_AVAILABLE:
         logger.error("Neither spaCy nor sklearn available for vectorization")
-        return np.zeros(VECTOR_DIMENSIONALITY)
+        return np.zeros(VECTOR_DIMENSIONALITY, dtype=VECTOR_DTYPE)
     
     from sklearn.feature_extraction.text import TfidfVectorizer
     from sklearn.feature_extraction.text import HashingVectorizer
@@ -125,7 +184,8 @@ def create_simple_tfidf_vector(text: str) -> np.ndarray:
         stop_words='english',
         ngram_range=(1, 2),
         lowercase=True,
-        norm='l2'  # L2 normalization for cosine similarity
+        norm='l2',  # L2 normalization for cosine similarity
+        dtype=VECTOR_DTYPE
     )
     
     try:
@@ -133,7 +193,39 @@ def create_simple_tfidf_vector(text: str) -> np.ndarray:
         return vector
     except Exception as e:
         logger.error(f"Error in TF-IDF vectorization: {e}")
-        return np.zeros(VECTOR_DIMENSIONALITY)
+        return np.zeros(VECTOR_DIMENSIONALITY, dtype=VECTOR_DTYPE)
+
+
+def create_simple_tfidf_vectors(texts: List[str]) -> np.ndarray:
+    """
+    Batch version of create_simple_tfidf_vector.
+    
+    Args:
+        texts: Document texts
+        
+    Returns:
+        Matrix of shape (len(texts), 300)
+    """
+    if not SKLEARN_AVAILABLE:
+        logger.error("Neither spaCy nor sklearn available for vectorization")
+        return np.zeros((len(texts), VECTOR_DIMENSIONALITY), dtype=VECTOR_DTYPE)
+    
+    from sklearn.feature_extraction.text import HashingVectorizer
+    
+    vectorizer = HashingVectorizer(
+        n_features=VECTOR_DIMENSIONALITY,
+        stop_words='english',
+        ngram_range=(1, 2),
+        lowercase=True,
+        norm='l2',
+        dtype=VECTOR_DTYPE
+    )
+    
+    try:
+        return vectorizer.transform(texts).toarray()
+    except Exception as e:
+        logger.error(f"Error in TF-IDF vectorization: {e}")
+        return np.zeros((len(texts), VECTOR_DIMENSIONALITY), dtype=VECTOR_DTYPE)
 
 
 def compute_tfidf_similarity(text1: str, text2: str) -> float:
@@ -218,6 +310,7 @@ class TfidfDocumentVectorizer:
         if not SKLEARN_AVAILABLE:
             raise RuntimeError("scikit-learn not available")
         
+        from sklearn.feature_extraction.text import TfidfVectorizer
         self.vectorizer = TfidfVectorizer(
             max_features=max_features,
             stop_words='english',
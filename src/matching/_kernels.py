@@ -0,0 +1,83 @@
+"""
+Similarity Kernels
+Cosine similarity kernels, JIT-compiled with numba when it is installed.
+"""
+import math
+from importlib.util import find_spec
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+# Probe only; numba is imported and the kernels compiled on first use so
+# importing src.matching stays cheap
+NUMBA_AVAILABLE = find_spec("numba") is not None
+
+# Rebound to numba.prange before _cosine_batch is compiled
+prange = range
+
+_jitted: Optional[Tuple[Callable, Callable]] = None
+
+
+def _cosine(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Cosine similarity of two vectors in one pass; 0.0 if either is zero.
+    
+    Sums are accumulated in float64 so float32 inputs keep full precision.
+    """
+    s = 0.0
+    na = 0.0
+    nb = 0.0
+    for i in range(a.shape[0]):
+        s += a[i] * b[i]
+        na += a[i] * a[i]
+        nb += b[i] * b[i]
+    if na == 0.0 or nb == 0.0:
+        return 0.0
+    return s / math.sqrt(na * nb)
+
+
+def _cosine_batch(q: np.ndarray, M: np.ndarray) -> np.ndarray:
+    """Cosine similarity of q against each row of M."""
+    out = np.empty(M.shape[0])
+    for r in prange(M.shape[0]):
+        out[r] = _cosine(q, M[r])
+    return out
+
+
+def _cosine_numpy(a: np.ndarray, b: np.ndarray) -> float:
+    """NumPy fallback for cosine()."""
+    norm = np.linalg.norm(a) * np.linalg.norm(b)
+    return float(np.dot(a, b) / norm) if norm else 0.0
+
+
+def _cosine_batch_numpy(q: np.ndarray, M: np.ndarray) -> np.ndarray:
+    """NumPy fallback for cosine_batch()."""
+    norms = np.linalg.norm(M, axis=1) * np.linalg.norm(q)
+    dots = M @ q
+    return np.divide(dots, norms, out=np.zeros(M.shape[0]), where=norms != 0)
+
+
+def _jit_kernels() -> Tuple[Callable, Callable]:
+    """Import numba and JIT-compile the kernels once, on first call."""
+    global _jitted, _cosine, prange
+    if _jitted is None:
+        import numba
+        # _cosine_batch resolves these globals when it is compiled
+        prange = numba.prange
+        _cosine = numba.njit(cache=True, fastmath=True)(_cosine)
+        _jitted = (_cosine, numba.njit(cache=True, fastmath=True, parallel=True)(_cosine_batch))
+    return _jitted
+
+
+def cosine(a: np.ndarray, b: np.ndarray) -> float:
+    """Cosine similarity of two vectors; 0.0 if either is zero."""
+    if NUMBA_AVAILABLE:
+        return _jit_kernels()[0](a, b)
+    return _cosine_numpy(a, b)
+
+
+def cosine_batch(q: np.ndarray, M: np.ndarray) -> np.ndarray:
+    """Cosine similarity of q against each row of M."""
+    if NUMBA_AVAILABLE:
+        return _jit_kernels()[1](q, M)
+    return _cosine_batch_numpy(q, M)
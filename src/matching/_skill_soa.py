@@ -0,0 +1,77 @@
+"""
+Skill Struct-of-Arrays
+Column-oriented view of skill dict lists for vectorized matching.
+"""
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+
+from config.settings import SKILL_IMPORTANCE_WEIGHTS
+
+# Importance labels in code order: critical, preferred, nice-to-have
+IMPORTANCE_LEVELS = tuple(SKILL_IMPORTANCE_WEIGHTS)
+IMPORTANCE_CODES = {label: code for code, label in enumerate(IMPORTANCE_LEVELS)}
+
+# Unrecognized labels share a trailing code, weighted like the scorer's 0.6 default
+UNKNOWN_IMPORTANCE = len(IMPORTANCE_LEVELS)
+IMPORTANCE_WEIGHTS = np.array([*SKILL_IMPORTANCE_WEIGHTS.values(), 0.6])
+
+
+@dataclass
+class SkillSoA:
+    """Skill names, importance codes and confidences as parallel arrays."""
+    
+    names: np.ndarray       # object array of skill names
+    importance: np.ndarray  # int8 codes into IMPORTANCE_LEVELS
+    confidence: np.ndarray  # float32, 1.0 when not given
+    
+    @classmethod
+    def from_dicts(cls, skills: List[Dict], default_importance: str = 'preferred') -> 'SkillSoA':
+        """
+        Build from a list of skill dicts.
+        
+        Args:
+            skills: Dicts with 'skill_name' and optional 'importance'/'confidence'
+            default_importance: Importance used when a dict has none
+            
+        Returns:
+            SkillSoA with one row per skill
+        """
+        count = len(skills)
+        names = np.empty(count, dtype=object)
+        names[:] = [s.get('skill_name', '') for s in skills]
+        importance = np.fromiter(
+            (IMPORTANCE_CODES.get(s.get('importance', default_importance), UNKNOWN_IMPORTANCE) for s in skills),
+            dtype=np.int8,
+            count=count
+        )
+        confidence = np.fromiter(
+            (s.get('confidence', 1.0) for s in skills),
+            dtype=np.float32,
+            count=count
+        )
+        return cls(names, importance, confidence)
+    
+    def __len__(self) -> int:
+        return self.names.shape[0]
+    
+    @property
+    def weights(self) -> np.ndarray:
+        """Importance weight of each skill."""
+        return IMPORTANCE_WEIGHTS[self.importance]
+    
+    def to_dicts(self) -> List[Dict]:
+        """
+        Convert back to skill dicts.
+        
+        Unrecognized importance labels come back as 'preferred'.
+        """
+        return [
+            {
+                'skill_name': name,
+                'importance': IMPORTANCE_LEVELS[code] if code < UNKNOWN_IMPORTANCE else 'preferred',
+                'confidence': float(conf)
+            }
+            for name, code, conf in zip(self.names, self.importance, self.confidence)
+        ]
@@ -7,6 +7,8 @@ import uuid
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from src.matching._skill_soa import SkillSoA, IMPORTANCE_CODES
+
 
 def generate_improvement_suggestions(
     resume_data: Dict,
@@ -43,9 +45,10 @@ def generate_improvement_suggestions(
     missing_skills = match_result.get('missing_skills', [])
     
     # 1. Analyze Missing Critical Skills
-    critical_missing = [s for s in missing_skills if s.get('importance') == 'critical']
-    if critical_missing:
-        skill_names = [s.get('skill_name', '') for s in critical_missing[:5]]
+    missing = SkillSoA.from_dicts(missing_skills)
+    critical_missing = missing.names[missing.importance == IMPORTANCE_CODES['critical']]
+    if critical_missing.size:
+        skill_names = critical_missing[:5].tolist()
         suggestions.append({
             'category': 'missing_critical_skills',
             'priority': 'high',
@@ -3,14 +3,17 @@ Multi-Job Matcher Module
 Compares one resume against multiple job descriptions.
 """
 import uuid
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
 
+from src.matching.similarity_scorer import calculate_semantic_similarities
+
 
 def compare_resume_to_jobs(
     resume_data: Dict,
     job_descriptions: List[Dict],
-    max_jobs: int = 5
+    max_jobs: int = 5,
+    pipeline=None
 ) -> Dict:
     """
     Compare one resume against multiple job descriptions.
@@ -19,6 +22,7 @@ def compare_resume_to_jobs(
         resume_data: Processed resume from existing pipeline
         job_descriptions: List of 2-5 job dictionaries with title, description, required_skills
         max_jobs: Maximum number of jobs to compare (default 5)
+        pipeline: ScreeningPipeline to reuse (a new one is built if omitted)
         
     Returns:
         Comparison results with ranked jobs
@@ -39,19 +43,24 @@ def compare_resume_to_jobs(
         if not job.get('description'):
             raise ValueError(f"Job {i+1} missing 'description' field")
     
-    # Import here to avoid circular imports
-    from pipeline.screening_pipeline import ScreeningPipeline
+    if pipeline is None:
+        # Import here to avoid circular imports
+        from pipeline.screening_pipeline import ScreeningPipeline
+        pipeline = ScreeningPipeline()
     
-    pipeline = ScreeningPipeline()
     results = []
     
-    # Process each job sequentially
-    for job in job_descriptions:
+    # Vectorize the jobs that still need it in one batch, then score the
+    # resume against every job vector with a single batched cosine
+    jobs = _prepare_jobs(pipeline, job_descriptions)
+    similarities = _semantic_similarities(resume_data, jobs)
+    
+    for job, prepared, similarity in zip(job_descriptions, jobs, similarities):
         job_id = job.get('job_id') or str(uuid.uuid4())
         
         try:
             # Use existing scoring function
-            match_result = pipeline.match_resume_to_job(resume_data, job)
+            match_result = pipeline.match_resume_to_job(resume_data, prepared, similarity)
             
             results.append({
                 'job_id': job_id,
@@ -89,7 +98,7 @@ def compare_resume_to_jobs(
     
     return {
         'comparison_id': str(uuid.uuid4()),
-        'resume_id': resume_data.get('resume_id') or str(uuid.uuid4()),
+        'resume_id': _field(resume_data, 'resume_id') or str(uuid.uuid4()),
         'timestamp': datetime.now().isoformat(),
         'num_jobs_compared': len(results),
         'best_match': {
@@ -101,6 +110,44 @@ def compare_resume_to_jobs(
     }
 
 
+def _prepare_jobs(pipeline, job_descriptions: List[Dict]) -> List:
+    """
+    Processed jobs for matching, in input order.
+    
+    Jobs that already carry a vector are used as given; the rest are
+    vectorized together with pipeline.process_job_descriptions.
+    """
+    pending = [i for i, job in enumerate(job_descriptions) if job.get('vector_representation') is None]
+    jobs = list(job_descriptions)
+    if pending:
+        processed = pipeline.process_job_descriptions([job_descriptions[i] for i in pending])
+        for i, job in zip(pending, processed):
+            jobs[i] = job
+    return jobs
+
+
+def _semantic_similarities(resume_data, jobs: List) -> List[Optional[float]]:
+    """
+    Semantic similarity of the resume to every job, computed in one batch.
+    
+    Falls back to None for every job (each match then computes its own
+    cosine and reports its own error) if the vectors cannot be stacked.
+    """
+    try:
+        job_vectors = [_field(job, 'vector_representation') for job in jobs]
+        sims = calculate_semantic_similarities(_field(resume_data, 'vector_representation'), job_vectors)
+        return sims.tolist()
+    except Exception:
+        return [None] * len(jobs)
+
+
+def _field(item, name: str):
+    """Read a field from either a dict or a model object."""
+    if isinstance(item, dict):
+        return item.get(name)
+    return getattr(item, name, None)
+
+
 def format_comparison_table(comparison_result: Dict) -> str:
     """
     Format comparison results as a text table for display.
@@ -8,13 +8,28 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 import numpy as np
 
-from config.settings import SCORING_WEIGHTS, SKILL_IMPORTANCE_WEIGHTS, MATCH_THRESHOLDS
+from config.settings import SCORING_WEIGHTS, MATCH_THRESHOLDS, VECTOR_DTYPE
 from config.logging_config import get_logger
-from src.feature_engineering.vectorizer import calculate_cosine_similarity
 from src.feature_engineering.skill_extractor import load_skill_synonyms
+from src.matching._kernels import cosine, cosine_batch
+from src.matching._skill_soa import SkillSoA
 
 logger = get_logger("similarity_scorer")
 
+# (synonyms dict, lowercased variant -> lowercased canonical name)
+_canonical_map = None
+
+# Recommendation label for each whole-percent score, built from
+# MATCH_THRESHOLDS (which must fall on whole percents)
+_THRESHOLD_PERCENTS = [
+    (round(MATCH_THRESHOLDS[label] * 100), label)
+    for label in ('strong-match', 'good-match', 'weak-match')
+]
+_RECOMMENDATION_TABLE = tuple(
+    next((label for pct, label in _THRESHOLD_PERCENTS if i >= pct), 'no-match')
+    for i in range(101)
+)
+
 
 def calculate_match_score(
     resume_vector: np.ndarray,
@@ -23,7 +38,8 @@ def calculate_match_score(
     required_skills: List[Dict],
     weights: Optional[Dict] = None,
     resume_text: Optional[str] = None,
-    job_text: Optional[str] = None
+    job_text: Optional[str] = None,
+    semantic_similarity: Optional[float] = None
 ) -> Dict[str, Any]:
     """
     Calculate match score between resume and job description.
@@ -36,6 +52,8 @@ def calculate_match_score(
         weights: Optional custom weights for scoring
         resume_text: Optional raw resume text for TF-IDF fallback
         job_text: Optional raw job text for TF-IDF fallback
+        semantic_similarity: Optional vector similarity already computed for
+            this pair (e.g. by calculate_semantic_similarities)
         
     Returns:
         Match result dictionary following MatchResult schema
@@ -43,13 +61,15 @@ def calculate_match_score(
     if weights is None:
         weights = SCORING_WEIGHTS.copy()
     
-    # Validate vector dimensions
-    if resume_vector.shape[0] != 300 or job_vector.shape[0] != 300:
-        logger.error("INVALID_VECTOR_DIMENSION: Vectors must be 300-dimensional")
-        raise ValueError("INVALID_VECTOR_DIMENSION: Vectors must be 300-dimensional")
-    
-    # Calculate semantic similarity
-    semantic_similarity = calculate_cosine_similarity(resume_vector, job_vector)
+    if semantic_similarity is None:
+        # Convert once to contiguous VECTOR_DTYPE so the cosine kernel runs on one dtype
+        resume_vector = np.ascontiguousarray(resume_vector, dtype=VECTOR_DTYPE)
+        job_vector = np.ascontiguousarray(job_vector, dtype=VECTOR_DTYPE)
+        _check_dimensions(resume_vector, job_vector)
+        
+        # Calculate semantic similarity, clamped to [0, 1]
+        semantic_similarity = float(cosine(resume_vector, job_vector))
+    semantic_similarity = max(0.0, min(1.0, float(semantic_similarity)))
     
     # Use TF-IDF similarity as a blended signal when available
     # This catches cases where spaCy vectors underperform (short text, missing model)
@@ -97,6 +117,37 @@ def calculate_match_score(
     return result
 
 
+def calculate_semantic_similarities(
+    resume_vector: np.ndarray,
+    job_vectors: List[np.ndarray]
+) -> np.ndarray:
+    """
+    Calculate the semantic similarity of one resume to many jobs at once.
+    
+    Stacks the job vectors into a (K, 300) matrix and scores them against
+    the resume in a single cosine_batch call.
+    
+    Args:
+        resume_vector: Vector representation of resume (300-dim)
+        job_vectors: Vector representations of K job descriptions (300-dim)
+        
+    Returns:
+        Array of K similarities clamped to [0, 1]
+    """
+    resume_vector = np.ascontiguousarray(resume_vector, dtype=VECTOR_DTYPE)
+    job_matrix = np.ascontiguousarray(np.stack(job_vectors), dtype=VECTOR_DTYPE)
+    _check_dimensions(resume_vector, job_matrix)
+    
+    return np.clip(cosine_batch(resume_vector, job_matrix), 0.0, 1.0)
+
+
+def _check_dimensions(*vectors: np.ndarray) -> None:
+    """Raise INVALID_VECTOR_DIMENSION unless every vector (or matrix row) is 300-dimensional."""
+    if any(v.shape[-1] != 300 for v in vectors):
+        logger.error("INVALID_VECTOR_DIMENSION: Vectors must be 300-dimensional")
+        raise ValueError("INVALID_VECTOR_DIMENSION: Vectors must be 300-dimensional")
+
+
 def calculate_skill_match(
     resume_skills: List[str],
     required_skills: List[Dict]
@@ -115,56 +166,85 @@ def calculate_skill_match(
         # No required skills - use semantic similarity only
         return 1.0, [], []
     
-    # Load synonyms for normalized matching
-    synonyms = load_skill_synonyms()
+    canonical = _get_canonical_map()
+    required = SkillSoA.from_dicts(required_skills)
+    req_lower, req_canonical = _normalize_required(required, canonical)
     
-    # Build a reverse map: canonical_lower -> canonical
-    # and also normalize resume skills through synonyms
-    def normalize_skill(skill_name: str) -> str:
-        """Normalize a skill name through synonym mapping."""
-        # Check if this skill is a synonym for something else
-        canonical = synonyms.get(skill_name, skill_name)
-        # Also check case-insensitive
-        for variant, canon in synonyms.items():
-            if variant.lower() == skill_name.lower():
-                return canon.lower()
-        return canonical.lower()
-    
-    resume_skills_normalized = {normalize_skill(s): s for s in resume_skills}
+    # Check if resume has each skill (with synonym normalization)
+    matched = _match_mask(req_lower, req_canonical, resume_skills, canonical)
     
-    matched_skills = []
-    missing_skills = []
-    weighted_sum = 0.0
-    total_weight = 0.0
+    # Calculate score: weights are gathered from the importance-code table
+    weights = required.weights
+    score = float(np.dot(matched, weights) / weights.sum())
     
-    for req_skill in required_skills:
-        skill_name = req_skill.get('skill_name', '')
-        importance = req_skill.get('importance', 'preferred')
-        weight = SKILL_IMPORTANCE_WEIGHTS.get(importance, 0.6)
-        
-        total_weight += weight
-        
-        # Check if resume has this skill (with synonym normalization)
-        req_normalized = normalize_skill(skill_name)
-        if req_normalized in resume_skills_normalized:
-            matched_skills.append(skill_name)
-            weighted_sum += weight
-        elif skill_name.lower() in [s.lower() for s in resume_skills]:
-            # Direct case-insensitive match as fallback
-            matched_skills.append(skill_name)
-            weighted_sum += weight
-        else:
-            missing_skills.append({
-                "skill_name": skill_name,
-                "importance": importance
-            })
-    
-    # Calculate score
-    score = weighted_sum / total_weight if total_weight > 0 else 0.0
+    # Convert back to the dict API only for the returned lists
+    matched_skills = required.names[matched].tolist()
+    missing_skills = [
+        {
+            "skill_name": required_skills[i].get('skill_name', ''),
+            "importance": required_skills[i].get('importance', 'preferred')
+        }
+        for i in np.flatnonzero(~matched)
+    ]
     
     return score, matched_skills, missing_skills
 
 
+def _normalize_required(required: SkillSoA, canonical: Dict[str, str]) -> tuple:
+    """Lowercased and canonical name arrays for required skills."""
+    req_lower = np.array([name.lower() for name in required.names], dtype=object)
+    req_canonical = np.array([canonical.get(name, name) for name in req_lower], dtype=object)
+    return req_lower, req_canonical
+
+
+def _match_mask(
+    req_lower: np.ndarray,
+    req_canonical: np.ndarray,
+    resume_skills: List[str],
+    canonical: Dict[str, str]
+) -> np.ndarray:
+    """
+    Boolean mask of required skills present in a resume.
+    
+    A skill matches on its canonical synonym or, failing that, on a direct
+    case-insensitive name match.
+    """
+    # Index required skills by column once; each resume skill is then a
+    # dict lookup per key instead of an np.isin over object arrays
+    by_canonical: Dict[str, List[int]] = {}
+    by_lower: Dict[str, List[int]] = {}
+    for k, (low, canon) in enumerate(zip(req_lower, req_canonical)):
+        by_canonical.setdefault(canon, []).append(k)
+        by_lower.setdefault(low, []).append(k)
+    
+    cols: List[int] = []
+    for skill in resume_skills:
+        low = skill.lower()
+        cols.extend(by_canonical.get(canonical.get(low, low), ()))
+        cols.extend(by_lower.get(low, ()))
+    
+    mask = np.zeros(len(req_lower), dtype=bool)
+    mask[cols] = True
+    return mask
+
+
+def _get_canonical_map() -> Dict[str, str]:
+    """
+    Map lowercased synonym variants to lowercased canonical names.
+    
+    Rebuilt only when the loaded synonyms dict changes; the first variant
+    wins on case collisions.
+    """
+    global _canonical_map
+    synonyms = load_skill_synonyms()
+    if _canonical_map is None or _canonical_map[0] is not synonyms:
+        mapping = {}
+        for variant, canon in synonyms.items():
+            mapping.setdefault(variant.lower(), canon.lower())
+        _canonical_map = (synonyms, mapping)
+    return _canonical_map[1]
+
+
 def get_recommendation(score: float) -> str:
     """
     Get recommendation label based on score.
@@ -175,14 +255,11 @@ def get_recommendation(score: float) -> str:
     Returns:
         Recommendation string
     """
-    if score >= MATCH_THRESHOLDS['strong-match']:
-        return 'strong-match'
-    elif score >= MATCH_THRESHOLDS['good-match']:
-        return 'good-match'
-    elif score >= MATCH_THRESHOLDS['weak-match']:
-        return 'weak-match'
-    else:
+    # NaN (from degenerate vectors) and -inf fall through like the old
+    # if/elif chain did; +inf is clamped before int() can overflow
+    if not score >= 0:
         return 'no-match'
+    return _RECOMMENDATION_TABLE[int(min(score, 1.0) * 100)]
 
 
 def batch_calculate_scores(
@@ -1,4 +1,4 @@
 """Data models module."""
 from .resume import Resume
 from .job_description import JobDescription
-from .match_result import MatchResult
+from .match_result import MatchResult, Recommendation
@@ -0,0 +1,18 @@
+"""
+String interning helpers for skill dicts.
+Skill keys and values such as 'importance'/'critical' recur across every
+resume and job, so decoded copies are collapsed onto one shared object.
+"""
+import sys
+from typing import Dict, List, Any
+
+_intern = sys.intern
+
+
+def intern_skills(skills: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Return skill dicts with string keys and string values interned."""
+    return [
+        {_intern(k): _intern(v) if type(v) is str else v for k, v in skill.items()}
+        if isinstance(skill, dict) else skill
+        for skill in skills
+    ]
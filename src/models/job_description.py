@@ -2,12 +2,25 @@
 Job Description Data Model
 Defines the JobDescription data structure.
 """
+import sys
 import uuid
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 import numpy as np
 
+from config.settings import VECTOR_DTYPE
+from ._strings import intern_skills
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+_CRITICAL = sys.intern('critical')
+
 
 @dataclass
 class JobDescription:
@@ -23,6 +36,19 @@ class JobDescription:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
+        data = self._to_serializable()
+        if data["vector_representation"] is not None:
+            data["vector_representation"] = data["vector_representation"].tolist()
+        return data
+    
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes, emitting the vector without a list round-trip."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self._to_serializable(), option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(self.to_dict()).encode('utf-8')
+    
+    def _to_serializable(self) -> Dict[str, Any]:
+        """Dictionary representation with the vector kept as an ndarray."""
         return {
             "job_id": self.job_id,
             "title": self.title[:200] if len(self.title) > 200 else self.title,
@@ -30,7 +56,7 @@ class JobDescription:
             "description": self.description[:10000] if len(self.description) > 10000 else self.description,
             "required_skills": self.required_skills,
             "min_experience_years": self.min_experience_years,
-            "vector_representation": self.vector_representation.tolist() if self.vector_representation is not None else None
+            "vector_representation": self.vector_representation
         }
     
     @classmethod
@@ -38,14 +64,14 @@ class JobDescription:
         """Create JobDescription from dictionary."""
         vector = data.get('vector_representation')
         if vector and not isinstance(vector, np.ndarray):
-            vector = np.array(vector)
+            vector = np.array(vector, dtype=VECTOR_DTYPE)
         
         return cls(
             job_id=data.get('job_id', str(uuid.uuid4())),
             title=data.get('title', ''),
             company=data.get('company'),
             description=data.get('description', ''),
-            required_skills=data.get('required_skills', []),
+            required_skills=intern_skills(data.get('required_skills', [])),
             min_experience_years=data.get('min_experience_years'),
             vector_representation=vector
         )
@@ -61,9 +87,9 @@ class JobDescription:
     def get_critical_skills(self) -> List[str]:
         """Get list of critical skill names."""
         return [
-            s.get('skill_name', '') 
-            for s in self.required_skills 
-            if s.get('importance') == 'critical'
+            s.get('skill_name', '')
+            for s in self.required_skills
+            if s.get('importance') == _CRITICAL
         ]
     
     def get_all_skill_names(self) -> List[str]:
@@ -73,8 +99,8 @@ class JobDescription:
     def add_skill(self, skill_name: str, importance: str = 'preferred') -> None:
         """Add a required skill."""
         self.required_skills.append({
-            'skill_name': skill_name,
-            'importance': importance
+            'skill_name': sys.intern(skill_name),
+            'importance': sys.intern(importance)
         })
     
     def __repr__(self) -> str:
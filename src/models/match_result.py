@@ -4,9 +4,46 @@ Defines the MatchResult data structure.
 """
 import uuid
 from datetime import datetime
+from enum import IntEnum
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+
+class Recommendation(IntEnum):
+    """Recommendation levels, ordered from weakest to strongest."""
+    UNKNOWN = -1
+    NO_MATCH = 0
+    WEAK = 1
+    GOOD = 2
+    STRONG = 3
+    
+    @property
+    def label(self) -> str:
+        """Display/serialized label, e.g. 'strong-match'."""
+        if self is Recommendation.UNKNOWN:
+            return _UNKNOWN_LABEL
+        return RECOMMENDATION_LABELS[self]
+    
+    @classmethod
+    def from_label(cls, label: str) -> 'Recommendation':
+        """Parse a label, treating unknown values as UNKNOWN."""
+        return cls(RECOMMENDATION_CODES.get(label, cls.UNKNOWN))
+
+
+# Indexed by Recommendation code
+RECOMMENDATION_LABELS = ('no-match', 'weak-match', 'good-match', 'strong-match')
+RECOMMENDATION_CODES = {label: code for code, label in enumerate(RECOMMENDATION_LABELS)}
+_EMOJIS = ('🔴', '🟠', '🟡', '🟢')
+_UNKNOWN_LABEL = 'unknown'
+_UNKNOWN_EMOJI = '⚪'
+
 
 @dataclass
 class MatchResult:
@@ -24,7 +61,12 @@ class MatchResult:
     
     matched_skills: List[str] = field(default_factory=list)
     missing_skills: List[Dict[str, str]] = field(default_factory=list)
-    recommendation: str = "no-match"
+    recommendation: Recommendation = Recommendation.NO_MATCH
+    
+    def __post_init__(self):
+        # Accept labels for backward compatibility
+        if not isinstance(self.recommendation, Recommendation):
+            self.recommendation = Recommendation.from_label(self.recommendation)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
@@ -41,9 +83,15 @@ class MatchResult:
             },
             "matched_skills": self.matched_skills,
             "missing_skills": self.missing_skills,
-            "recommendation": self.recommendation
+            "recommendation": self.recommendation.label
         }
     
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict()).encode('utf-8')
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'MatchResult':
         """Create MatchResult from dictionary."""
@@ -65,21 +113,17 @@ class MatchResult:
     
     def is_strong_match(self) -> bool:
         """Check if this is a strong match."""
-        return self.recommendation == 'strong-match'
+        return self.recommendation is Recommendation.STRONG
     
     def is_acceptable(self) -> bool:
         """Check if match is at least acceptable (good or strong)."""
-        return self.recommendation in ['strong-match', 'good-match']
+        return self.recommendation >= Recommendation.GOOD
     
     def get_recommendation_emoji(self) -> str:
         """Get emoji for recommendation level."""
-        emojis = {
-            'strong-match': '🟢',
-            'good-match': '🟡',
-            'weak-match': '🟠',
-            'no-match': '🔴'
-        }
-        return emojis.get(self.recommendation, '⚪')
+        if self.recommendation is Recommendation.UNKNOWN:
+            return _UNKNOWN_EMOJI
+        return _EMOJIS[self.recommendation]
     
     def __repr__(self) -> str:
-        return f"MatchResult(score={self.overall_score:.2f}, rec={self.recommendation})"
+        return f"MatchResult(score={self.overall_score:.2f}, rec={self.recommendation.label})"
@@ -8,6 +8,16 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 import numpy as np
 
+from config.settings import VECTOR_DTYPE
+from ._strings import intern_skills
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
 
 @dataclass
 class Resume:
@@ -38,6 +48,19 @@ class Resume:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
+        data = self._to_serializable()
+        if data["vector_representation"] is not None:
+            data["vector_representation"] = data["vector_representation"].tolist()
+        return data
+    
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes, emitting the vector without a list round-trip."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self._to_serializable(), option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(self.to_dict()).encode('utf-8')
+    
+    def _to_serializable(self) -> Dict[str, Any]:
+        """Dictionary representation with the vector kept as an ndarray."""
         return {
             "resume_id": self.resume_id,
             "timestamp": self.timestamp,
@@ -50,7 +73,7 @@ class Resume:
             "skills": self.skills,
             "experience_years": self.experience_years,
             "education_level": self.education_level,
-            "vector_representation": self.vector_representation.tolist() if self.vector_representation is not None else None,
+            "vector_representation": self.vector_representation,
             "processing_metadata": {
                 "extraction_method": self.extraction_method,
                 "num_pages": self.num_pages,
@@ -66,7 +89,7 @@ class Resume:
         
         vector = data.get('vector_representation')
         if vector and not isinstance(vector, np.ndarray):
-            vector = np.array(vector)
+            vector = np.array(vector, dtype=VECTOR_DTYPE)
         
         return cls(
             resume_id=data.get('resume_id', str(uuid.uuid4())),
@@ -75,7 +98,7 @@ class Resume:
             email=candidate.get('email'),
             phone=candidate.get('phone'),
             extracted_text=data.get('extracted_text', ''),
-            skills=data.get('skills', []),
+            skills=intern_skills(data.get('skills', [])),
             experience_years=data.get('experience_years'),
             education_level=data.get('education_level'),
             vector_representation=vector,
@@ -2,12 +2,31 @@
 Batch Processing Module
 Process multiple resumes against a single job description.
 """
+import csv
+import io
+import os
 import uuid
 import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Dict, List, Optional, Callable
 from datetime import datetime
 
+import numpy as np
+
+from config.settings import BATCH_MAX_WORKERS
+from src.models.match_result import Recommendation, RECOMMENDATION_CODES
+
+# Column order for the struct-of-arrays result layout
+RESULT_COLUMNS = (
+    'resume_id', 'filename', 'candidate_name', 'candidate_email', 'overall_score',
+    'subscores', 'matched_skills', 'missing_skills', 'recommendation'
+)
+
+# Per-process pipeline used by _extract_one
+_worker_pipeline = None
+
 
 def batch_process_resumes(
     resume_files: List[str],
@@ -40,12 +59,12 @@ def batch_process_resumes(
     if not job_data.get('description') and not job_data.get('raw_text'):
         raise ValueError("Job description is required")
     
+    # Build each Path and stat it once; reused by the size check and the processing loop
+    paths = [Path(file_path) for file_path in resume_files]
+    file_stats = [_stat_or_none(path) for path in paths]
+    
     # Check total file size
-    total_size_bytes = 0
-    for file_path in resume_files:
-        path = Path(file_path)
-        if path.exists():
-            total_size_bytes += path.stat().st_size
+    total_size_bytes = sum(st.st_size for st in file_stats if st is not None)
     
     max_total_size = 50 * 1024 * 1024  # 50MB
     if total_size_bytes > max_total_size:
@@ -56,77 +75,106 @@ def batch_process_resumes(
     
     pipeline = ScreeningPipeline()
     
-    results = []
+    columns = {name: [] for name in RESULT_COLUMNS}
     failed_resumes = []
     start_time = time.time()
     
     job_title = job_data.get('title', 'Job Position')
+    job_text = job_data.get('description', job_data.get('raw_text', ''))
     
-    # Process each resume sequentially
-    for i, file_path in enumerate(resume_files):
-        filename = Path(file_path).name
-        
-        # Progress callback
-        if progress_callback:
-            progress_callback(i + 1, len(resume_files), f"Processing: {filename}")
+    # Extract every resume first so they can be vectorized as one batch.
+    # Valid files are fanned out across worker processes; results are
+    # collected in upload order so failures and ties stay deterministic.
+    valid = [
+        str(path) for path, file_stat in zip(paths, file_stats)
+        if file_stat is not None and path.suffix.lower() == '.pdf'
+    ]
+    num_workers = min(len(valid), BATCH_MAX_WORKERS)
+    pool = ProcessPoolExecutor(max_workers=num_workers) if num_workers > 1 else nullcontext()
+    
+    extracted = []
+    # The pool is shut down even if a progress callback raises mid-loop
+    with pool as executor:
+        futures = {p: executor.submit(_extract_one, p) for p in valid} if executor else {}
         
-        try:
-            # Validate file exists and is PDF
-            path = Path(file_path)
-            if not path.exists():
-                raise FileNotFoundError(f"File not found: {file_path}")
-            if path.suffix.lower() != '.pdf':
-                raise ValueError(f"Invalid file type: {path.suffix}")
+        for i, (path, file_stat) in enumerate(zip(paths, file_stats)):
+            filename = path.name
+            suffix = path.suffix
             
-            # Process through pipeline
-            result = pipeline.screen_resume(
-                resume_path=str(path),
-                job_description=job_data.get('description', job_data.get('raw_text', '')),
-                job_title=job_title
-            )
+            # Progress callback
+            if progress_callback:
+                progress_callback(i + 1, len(paths), f"Processing: {filename}")
             
-            resume_info = result.get('resume', {})
-            match_info = result.get('match', {})
-            candidate = resume_info.get('candidate', {})
+            try:
+                # Validate file exists and is PDF
+                if file_stat is None:
+                    raise FileNotFoundError(f"File not found: {path}")
+                if suffix.lower() != '.pdf':
+                    raise ValueError(f"Invalid file type: {suffix}")
             
-            results.append({
-                'resume_id': str(uuid.uuid4()),
-                'filename': filename,
-                'candidate_name': candidate.get('name', 'Unknown'),
-                'candidate_email': candidate.get('email'),
-                'overall_score': match_info.get('overall_score', 0),
-                'subscores': match_info.get('subscores', {}),
-                'matched_skills': match_info.get('matched_skills', []),
-                'missing_skills': match_info.get('missing_skills', []),
-                'recommendation': match_info.get('recommendation', 'unknown')
-            })
+                future = futures.get(str(path))
+                resume = future.result() if future else pipeline.extract_resume(str(path))
+                extracted.append((filename, resume))
             
-        except FileNotFoundError as e:
-            failed_resumes.append({
-                'filename': filename,
-                'error_code': 'FILE_NOT_FOUND',
-                'error_message': str(e)
-            })
-        except ValueError as e:
-            failed_resumes.append({
+            except FileNotFoundError as e:
+                failed_resumes.append({
+                    'filename': filename,
+                    'error_code': 'FILE_NOT_FOUND',
+                    'error_message': str(e)
+                })
+            except ValueError as e:
+                failed_resumes.append({
+                    'filename': filename,
+                    'error_code': 'INVALID_FILE',
+                    'error_message': str(e)
+                })
+            except Exception as e:
+                error_code = 'PDF_CORRUPTED' if 'pdf' in str(e).lower() else 'PROCESSING_ERROR'
+                failed_resumes.append({
+                    'filename': filename,
+                    'error_code': error_code,
+                    'error_message': str(e)
+                })
+    
+    # Vectorize all resumes in one batch and process the job only once;
+    # failures are reported per file instead of aborting the batch
+    extracted = _vectorize_extracted(pipeline, extracted, failed_resumes)
+    if extracted:
+        try:
+            job = pipeline.process_job_description(job_text, job_title)
+        except Exception as e:
+            failed_resumes.extend({
                 'filename': filename,
-                'error_code': 'INVALID_FILE',
-                'error_message': str(e)
-            })
+                'error_code': 'PROCESSING_ERROR',
+                'error_message': f"Job description processing failed: {e}"
+            } for filename, _ in extracted)
+            extracted = []
+    
+    for filename, resume in extracted:
+        try:
+            match_info = pipeline.match_resume_to_job(resume, job)
         except Exception as e:
-            error_code = 'PDF_CORRUPTED' if 'pdf' in str(e).lower() else 'PROCESSING_ERROR'
             failed_resumes.append({
                 'filename': filename,
-                'error_code': error_code,
+                'error_code': 'PROCESSING_ERROR',
                 'error_message': str(e)
             })
+            continue
+        
+        columns['resume_id'].append(resume.resume_id)
+        columns['filename'].append(filename)
+        columns['candidate_name'].append(resume.name)
+        columns['candidate_email'].append(resume.email)
+        columns['overall_score'].append(match_info.get('overall_score', 0))
+        columns['subscores'].append(match_info.get('subscores', {}))
+        columns['matched_skills'].append(match_info.get('matched_skills', []))
+        columns['missing_skills'].append(match_info.get('missing_skills', []))
+        columns['recommendation'].append(match_info.get('recommendation', 'unknown'))
     
-    # Sort results by overall_score descending
-    results.sort(key=lambda x: x.get('overall_score', 0), reverse=True)
-    
-    # Add ranks
-    for i, result in enumerate(results):
-        result['rank'] = i + 1
+    # Rank by overall_score descending (stable, so ties keep upload order)
+    scores = np.asarray(columns['overall_score'], dtype=np.float64)
+    order = np.argsort(-scores, kind='stable')
+    results = to_records(columns, order)
     
     processing_time = time.time() - start_time
     
@@ -143,6 +191,86 @@ def batch_process_resumes(
     }
 
 
+def _vectorize_extracted(pipeline, extracted: List, failed_resumes: List[Dict]) -> List:
+    """
+    Vectorize extracted resumes in one batch, isolating failures per file.
+    
+    If the batch call fails, each resume is retried on its own so only the
+    ones that really cannot be vectorized are moved to failed_resumes.
+    
+    Args:
+        pipeline: ScreeningPipeline used for vectorization
+        extracted: List of (filename, Resume) pairs
+        failed_resumes: Failure records, appended to in place
+        
+    Returns:
+        The (filename, Resume) pairs that now have vectors
+    """
+    try:
+        pipeline.vectorize_resumes([resume for _, resume in extracted])
+        return extracted
+    except Exception:
+        pass
+    
+    vectorized = []
+    for filename, resume in extracted:
+        try:
+            pipeline.vectorize_resumes([resume])
+        except Exception as e:
+            failed_resumes.append({
+                'filename': filename,
+                'error_code': 'PROCESSING_ERROR',
+                'error_message': str(e)
+            })
+            continue
+        vectorized.append((filename, resume))
+    return vectorized
+
+
+def _extract_one(pdf_path: str):
+    """
+    Extract a resume in a worker process.
+    
+    Each worker builds its own pipeline on first use and reuses it for
+    the rest of the batch.
+    """
+    global _worker_pipeline
+    if _worker_pipeline is None:
+        from pipeline.screening_pipeline import ScreeningPipeline
+        _worker_pipeline = ScreeningPipeline()
+    return _worker_pipeline.extract_resume(pdf_path)
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Stat a file, returning None if it does not exist."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def to_records(columns: Dict[str, list], order: Optional[np.ndarray] = None) -> List[Dict]:
+    """
+    Convert column-oriented batch results into a ranked list of dicts.
+    
+    Args:
+        columns: Mapping of RESULT_COLUMNS names to equal-length lists
+        order: Row indices in rank order (defaults to current order)
+        
+    Returns:
+        List of result dicts, each with a 'rank' key
+    """
+    if order is None:
+        order = range(len(columns['overall_score']))
+    
+    records = []
+    for rank, i in enumerate(order, start=1):
+        record = {name: columns[name][i] for name in RESULT_COLUMNS}
+        record['rank'] = rank
+        records.append(record)
+    return records
+
+
 def format_batch_results_table(batch_result: Dict) -> str:
     """
     Format batch results as a text table.
@@ -201,25 +329,32 @@ def export_batch_results_csv(batch_result: Dict) -> str:
     """
     results = batch_result.get('results', [])
     
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    
     # CSV header
-    lines = ["Rank,Candidate Name,Email,Filename,Overall Score,Skill Match,Semantic Similarity,Recommendation,Matched Skills Count,Missing Skills Count"]
+    writer.writerow([
+        'Rank', 'Candidate Name', 'Email', 'Filename', 'Overall Score', 'Skill Match',
+        'Semantic Similarity', 'Recommendation', 'Matched Skills Count', 'Missing Skills Count'
+    ])
     
-    for result in results:
-        row = [
-            str(result.get('rank', '')),
-            f'"{result.get("candidate_name", "Unknown")}"',
-            f'"{result.get("candidate_email", "") or ""}"',
-            f'"{result.get("filename", "")}"',
-            f'{result.get("overall_score", 0):.2%}',
-            f'{result.get("subscores", {}).get("skill_match", 0):.2%}',
-            f'{result.get("subscores", {}).get("semantic_similarity", 0):.2%}',
+    writer.writerows(
+        (
+            result.get('rank', ''),
+            result.get('candidate_name', 'Unknown'),
+            result.get('candidate_email', '') or '',
+            result.get('filename', ''),
+            f"{result.get('overall_score', 0):.2%}",
+            f"{result.get('subscores', {}).get('skill_match', 0):.2%}",
+            f"{result.get('subscores', {}).get('semantic_similarity', 0):.2%}",
             result.get('recommendation', 'unknown'),
-            str(len(result.get('matched_skills', []))),
-            str(len(result.get('missing_skills', [])))
-        ]
-        lines.append(','.join(row))
+            len(result.get('matched_skills', [])),
+            len(result.get('missing_skills', []))
+        )
+        for result in results
+    )
     
-    return '\n'.join(lines)
+    return buffer.getvalue()
 
 
 def get_top_candidates(batch_result: Dict, top_n: int = 3) -> List[Dict]:
@@ -259,17 +394,28 @@ def get_batch_statistics(batch_result: Dict) -> Dict:
             'no_matches': 0
         }
     
-    scores = [r.get('overall_score', 0) for r in results]
-    recommendations = [r.get('recommendation', '') for r in results]
+    scores = np.fromiter(
+        (r.get('overall_score', 0) for r in results),
+        dtype=np.float64,
+        count=len(results)
+    )
+    
+    # Unknown labels land in an extra overflow bucket
+    codes = np.fromiter(
+        (RECOMMENDATION_CODES.get(r.get('recommendation', ''), len(RECOMMENDATION_CODES)) for r in results),
+        dtype=np.int8,
+        count=len(results)
+    )
+    counts = np.bincount(codes, minlength=len(RECOMMENDATION_CODES) + 1)
     
     return {
         'total_processed': len(results),
-        'average_score': sum(scores) / len(scores) if scores else 0,
-        'highest_score': max(scores) if scores else 0,
-        'lowest_score': min(scores) if scores else 0,
-        'strong_matches': recommendations.count('strong-match'),
-        'good_matches': recommendations.count('good-match'),
-        'weak_matches': recommendations.count('weak-match'),
-        'no_matches': recommendations.count('no-match'),
+        'average_score': float(scores.mean()),
+        'highest_score': float(scores.max()),
+        'lowest_score': float(scores.min()),
+        'strong_matches': int(counts[Recommendation.STRONG]),
+        'good_matches': int(counts[Recommendation.GOOD]),
+        'weak_matches': int(counts[Recommendation.WEAK]),
+        'no_matches': int(counts[Recommendation.NO_MATCH]),
         'failed_count': len(batch_result.get('failed_resumes', []))
     }
@@ -1,4 +1,4 @@
 """Preprocessing module for PDF extraction and text cleaning."""
-from .pdf_extractor import extract_text_from_pdf
+from .pdf_extractor import extract_text_from_pdf, extract_text_from_pdf_bytes
 from .text_cleaner import clean_text
 from .parser import parse_resume_info
@@ -0,0 +1,35 @@
+"""
+Regex Backend
+Compiles patterns with google-re2 when it is installed, else the stdlib re.
+
+RE2 matches in linear time without backtracking, but its \\d, \\s, \\w and
+\\b classes are ASCII-only, and its sub() is far slower than re's. Only
+compile ASCII-only patterns here, and only where a benchmark shows RE2
+winning (e.g. unanchored searches over a whole resume). Pass flags
+inline, e.g. (?i), since RE2 does not take re module flags.
+"""
+import re
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+def compile(pattern: str):
+    """
+    Compile a pattern with RE2, falling back to re for unsupported syntax.
+    
+    Args:
+        pattern: Regular expression with any flags given inline
+        
+    Returns:
+        Compiled pattern exposing search/match/sub
+    """
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
@@ -3,12 +3,45 @@ Resume Parser Module
 Parses structured information from resume text (name, email, phone, etc.).
 """
 import re
-from typing import Dict, Any, Optional, List
+from importlib.util import find_spec
+from typing import Dict, Any, Optional, List, Callable
+
+import numpy as np
+
+# Probe only; numba is imported and _find_yoe compiled on first use
+NUMBA_AVAILABLE = find_spec("numba") is not None
 
 from config.logging_config import get_logger
+from src.preprocessing import _regex
 
 logger = get_logger("parser")
 
+# Compiled once at import; reused by every call below.
+# The email search is several times faster under RE2 and its character
+# classes are ASCII either way; everything else relies on Unicode \s/\w
+# (phone separators, non-ASCII profile slugs) and stays on re.
+_EMAIL_RE = _regex.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RES = (
+    re.compile(r'\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}'),  # US format
+    re.compile(r'\+?[0-9]{1,3}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}'),  # International
+    re.compile(r'\b[0-9]{10,12}\b'),  # Plain numbers
+)
+_NON_PHONE_CHARS_RE = re.compile(r'[^\d+]')
+_LINKEDIN_RE = re.compile(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+', re.IGNORECASE)
+_GITHUB_RE = re.compile(r'(?:https?://)?(?:www\.)?github\.com/[\w-]+', re.IGNORECASE)
+_CONTACT_DIGITS_RE = re.compile(r'\d{3}[-.\s]?\d{3}')
+_YOE_RES = (
+    re.compile(r'(\d+)\+?\s*years?\s*(?:of\s*)?experience', re.IGNORECASE),
+    re.compile(r'experience[:\s]*(\d+)\+?\s*years?', re.IGNORECASE),
+)
+_EDUCATION_LEVELS = (
+    (re.compile(r'\b(?:ph\.?d|doctorate|doctoral)\b'), 'PhD'),
+    (re.compile(r'\b(?:master\'?s?|m\.?s\.?|m\.?a\.?|mba|m\.?tech)\b'), 'Masters'),
+    (re.compile(r'\b(?:bachelor\'?s?|b\.?s\.?|b\.?a\.?|b\.?tech|b\.?e\.?)\b'), 'Bachelors'),
+    (re.compile(r'\b(?:associate\'?s?|a\.?s\.?|a\.?a\.?)\b'), 'Associates'),
+    (re.compile(r'\b(?:high\s*school|diploma)\b'), 'High School'),
+)
+
 
 def parse_resume_info(text: str) -> Dict[str, Any]:
     """
@@ -63,26 +96,19 @@ def parse_resume_info(text: str) -> Dict[str, Any]:
 
 def extract_email(text: str) -> Optional[str]:
     """Extract email address from text."""
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    match = re.search(email_pattern, text)
+    match = _EMAIL_RE.search(text)
     return match.group(0) if match else None
 
 
 def extract_phone(text: str) -> Optional[str]:
     """Extract phone number from text."""
     # Various phone formats
-    phone_patterns = [
-        r'\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',  # US format
-        r'\+?[0-9]{1,3}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}',  # International
-        r'\b[0-9]{10,12}\b',  # Plain numbers
-    ]
-    
-    for pattern in phone_patterns:
-        match = re.search(pattern, text)
+    for pattern in _PHONE_RES:
+        match = pattern.search(text)
         if match:
             phone = match.group(0)
             # Clean up the phone number
-            cleaned = re.sub(r'[^\d+]', '', phone)
+            cleaned = _NON_PHONE_CHARS_RE.sub('', phone)
             if len(cleaned) >= 10:
                 return phone
     
@@ -91,15 +117,13 @@ def extract_phone(text: str) -> Optional[str]:
 
 def extract_linkedin(text: str) -> Optional[str]:
     """Extract LinkedIn URL from text."""
-    linkedin_pattern = r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+'
-    match = re.search(linkedin_pattern, text, re.IGNORECASE)
+    match = _LINKEDIN_RE.search(text)
     return match.group(0) if match else None
 
 
 def extract_github(text: str) -> Optional[str]:
     """Extract GitHub URL from text."""
-    github_pattern = r'(?:https?://)?(?:www\.)?github\.com/[\w-]+'
-    match = re.search(github_pattern, text, re.IGNORECASE)
+    match = _GITHUB_RE.search(text)
     return match.group(0) if match else None
 
 
@@ -118,7 +142,7 @@ def extract_name(text: str) -> Optional[str]:
             continue
         
         # Skip lines that look like contact info
-        if '@' in line or re.search(r'\d{3}[-.\s]?\d{3}', line):
+        if '@' in line or _CONTACT_DIGITS_RE.search(line):
             continue
         
         # Skip common headers
@@ -135,6 +159,89 @@ def extract_name(text: str) -> Optional[str]:
     return None
 
 
+def _is_space(c: int) -> bool:
+    """Match the ASCII characters covered by the regex \\s class."""
+    return c == 32 or 9 <= c <= 13 or 28 <= c <= 31
+
+
+def _matches_experience(buf: np.ndarray, start: int) -> bool:
+    """Check whether buf contains b'experience' at start."""
+    word = (101, 120, 112, 101, 114, 105, 101, 110, 99, 101)
+    if start + 10 > buf.shape[0]:
+        return False
+    for k in range(10):
+        if buf[start + k] != word[k]:
+            return False
+    return True
+
+
+def _find_yoe(buf: np.ndarray) -> int:
+    """
+    Scan lowercase ASCII bytes for '<digits>[+] year[s] [of] experience'.
+    
+    Equivalent to the first regex in extract_years_of_experience.
+    
+    Returns:
+        Years value, -1 if there is no match, or -2 if the digit run
+        is too long to fit in an int64
+    """
+    n = buf.shape[0]
+    for i in range(n - 3):
+        # b'year'
+        if not (buf[i] == 121 and buf[i + 1] == 101 and buf[i + 2] == 97 and buf[i + 3] == 114):
+            continue
+        
+        # Walk backward over whitespace, an optional '+', then the digits
+        j = i - 1
+        while j >= 0 and _is_space(buf[j]):
+            j -= 1
+        if j >= 0 and buf[j] == 43:
+            j -= 1
+        end = j
+        while j >= 0 and 48 <= buf[j] <= 57:
+            j -= 1
+        if j == end:
+            continue
+        
+        # Walk forward over an optional 's', whitespace and an optional 'of'
+        k = i + 4
+        if k < n and buf[k] == 115:
+            k += 1
+        while k < n and _is_space(buf[k]):
+            k += 1
+        found = _matches_experience(buf, k)
+        if not found and k + 1 < n and buf[k] == 111 and buf[k + 1] == 102:
+            m = k + 2
+            while m < n and _is_space(buf[m]):
+                m += 1
+            found = _matches_experience(buf, m)
+        if not found:
+            continue
+        
+        if end - j > 18:
+            return -2
+        years = 0
+        for d in range(j + 1, end + 1):
+            years = years * 10 + (int(buf[d]) - 48)
+        return years
+    return -1
+
+
+_find_yoe_jit: Optional[Callable[[np.ndarray], int]] = None
+
+
+def _jit_find_yoe() -> Callable[[np.ndarray], int]:
+    """Import numba and JIT-compile _find_yoe once, on first call."""
+    global _find_yoe_jit, _is_space, _matches_experience
+    if _find_yoe_jit is None:
+        from numba import njit
+        # _find_yoe resolves these helpers as globals when it is compiled
+        _is_space = njit(cache=True)(_is_space)
+        _matches_experience = njit(cache=True)(_matches_experience)
+        _find_yoe_jit = njit(cache=True)(_find_yoe)
+    return _find_yoe_jit
+
+
 def extract_years_of_experience(text: str) -> Optional[int]:
     """
     Attempt to extract years of experience from resume text.
@@ -146,13 +253,18 @@ def extract_years_of_experience(text: str) -> Optional[int]:
         Estimated years of experience or None
     """
     # Look for explicit mentions
-    patterns = [
-        r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
-        r'experience[:\s]*(\d+)\+?\s*years?',
-    ]
+    patterns = _YOE_RES
+    
+    # Compiled scan for the first pattern; only valid for ASCII text
+    if NUMBA_AVAILABLE and text.isascii():
+        years = _jit_find_yoe()(np.frombuffer(text.lower().encode('ascii'), dtype=np.uint8))
+        if years >= 0:
+            return int(years)
+        if years == -1:
+            patterns = patterns[1:]
     
     for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = pattern.search(text)
         if match:
             try:
                 return int(match.group(1))
@@ -172,18 +284,10 @@ def extract_education_level(text: str) -> Optional[str]:
     Returns:
         Education level string or None
     """
-    education_levels = [
-        (r'\b(?:ph\.?d|doctorate|doctoral)\b', 'PhD'),
-        (r'\b(?:master\'?s?|m\.?s\.?|m\.?a\.?|mba|m\.?tech)\b', 'Masters'),
-        (r'\b(?:bachelor\'?s?|b\.?s\.?|b\.?a\.?|b\.?tech|b\.?e\.?)\b', 'Bachelors'),
-        (r'\b(?:associate\'?s?|a\.?s\.?|a\.?a\.?)\b', 'Associates'),
-        (r'\b(?:high\s*school|diploma)\b', 'High School'),
-    ]
-    
     text_lower = text.lower()
     
-    for pattern, level in education_levels:
-        if re.search(pattern, text_lower):
+    for pattern, level in _EDUCATION_LEVELS:
+        if pattern.search(text_lower):
             return level
     
     return None
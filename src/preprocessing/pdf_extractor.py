@@ -2,11 +2,19 @@
 PDF Text Extractor Module
 Extracts text content from PDF resume files.
 """
+import io
 import os
-from typing import Dict, Any, Optional
+from contextlib import closing
+from typing import Dict, Any, Iterable, Optional, Union
 from pathlib import Path
 
 # PDF processing libraries (imported conditionally)
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
 try:
     import pdfplumber
     PDFPLUMBER_AVAILABLE = True
@@ -31,6 +39,9 @@ from config.logging_config import get_logger
 
 logger = get_logger("pdf_extractor")
 
+# A PDF given either as a file path or as its raw bytes
+PDFSource = Union[str, bytes]
+
 
 class PDFExtractionError(Exception):
     """Custom exception for PDF extraction errors."""
@@ -42,14 +53,14 @@ class PDFExtractionError(Exception):
 
 def extract_text_from_pdf(
     file_path: str,
-    method: str = 'pdfplumber'
+    method: str = 'pymupdf'
 ) -> Dict[str, Any]:
     """
     Extract text content from a PDF file.
     
     Args:
         file_path: Path to the PDF file
-        method: Extraction method ('pdfplumber' or 'pypdf2')
+        method: Extraction method ('pymupdf', 'pdfplumber' or 'pypdf2')
         
     Returns:
         Dictionary containing:
@@ -64,25 +75,55 @@ def extract_text_from_pdf(
         FileNotFoundError: If file does not exist
         ValueError: If file exceeds size or page limits
     """
+    path = Path(file_path)
+    
+    # Check extension before touching the filesystem
+    if path.suffix.lower() != '.pdf':
+        raise PDFExtractionError("INVALID_FILE_TYPE", f"File must be a PDF: {file_path}")
+    
+    # Check existence and size with a single stat call
+    try:
+        file_size = os.stat(file_path).st_size
+    except FileNotFoundError:
+        raise PDFExtractionError("PDF_FILE_NOT_FOUND", f"File does not exist: {file_path}")
+    
+    return _extract(str(file_path), file_size, method)
+
+
+def extract_text_from_pdf_bytes(
+    data: Union[bytes, bytearray, memoryview],
+    method: str = 'pymupdf'
+) -> Dict[str, Any]:
+    """
+    Extract text content from an in-memory PDF, such as an uploaded file.
+    
+    Same checks and result as extract_text_from_pdf, without writing the
+    PDF to disk first.
+    
+    Args:
+        data: Raw PDF bytes
+        method: Extraction method ('pymupdf', 'pdfplumber' or 'pypdf2')
+        
+    Returns:
+        Dictionary with the same keys as extract_text_from_pdf
+    """
+    # One immutable copy up front; every backend below can then share it
+    if not isinstance(data, bytes):
+        data = bytes(data)
+    return _extract(data, len(data), method)
+
+
+def _extract(source: PDFSource, file_size: int, method: str) -> Dict[str, Any]:
+    """Run the size/page checks and text extraction shared by both entry points."""
     result = {
         "text": "",
         "num_pages": 0,
-        "file_size_bytes": 0,
+        "file_size_bytes": file_size,
         "extraction_method": method,
         "success": False,
         "error": None
     }
     
-    path = Path(file_path)
-    
-    # Check if file exists
-    if not path.exists():
-        raise PDFExtractionError("PDF_FILE_NOT_FOUND", f"File does not exist: {file_path}")
-    
-    # Check file size
-    file_size = path.stat().st_size
-    result["file_size_bytes"] = file_size
-    
     if file_size > MAX_FILE_SIZE_BYTES:
         raise PDFExtractionError(
             "PDF_TOO_LARGE",
@@ -90,23 +131,28 @@ def extract_text_from_pdf(
         )
     
     try:
-        if method == 'pdfplumber' and PDFPLUMBER_AVAILABLE:
-            text, num_pages = _extract_with_pdfplumber(file_path)
-        elif PYPDF2_AVAILABLE:
-            text, num_pages = _extract_with_pypdf2(file_path)
-            result["extraction_method"] = "pypdf2"
-        else:
-            raise PDFExtractionError(
-                "PDF_LIBRARY_NOT_FOUND",
-                "No PDF extraction library available"
-            )
+        # Each extractor checks the page limit as soon as it has the document open
+        text = None
+        if method == 'pymupdf' and PYMUPDF_AVAILABLE:
+            try:
+                text, num_pages = _extract_with_pymupdf(source)
+            except PDFExtractionError:
+                raise
+            except Exception as e:
+                logger.warning(f"PyMuPDF extraction failed, falling back: {e}")
         
-        # Check page limit
-        if num_pages > MAX_RESUME_PAGES:
-            raise PDFExtractionError(
-                "PDF_TOO_MANY_PAGES",
-                f"PDF has {num_pages} pages, exceeds limit of {MAX_RESUME_PAGES}"
-            )
+        if text is None:
+            if method in ('pymupdf', 'pdfplumber') and PDFPLUMBER_AVAILABLE:
+                text, num_pages = _extract_with_pdfplumber(source)
+                result["extraction_method"] = "pdfplumber"
+            elif PYPDF2_AVAILABLE:
+                text, num_pages = _extract_with_pypdf2(source)
+                result["extraction_method"] = "pypdf2"
+            else:
+                raise PDFExtractionError(
+                    "PDF_LIBRARY_NOT_FOUND",
+                    "No PDF extraction library available"
+                )
         
         # Check if text was extracted
         if not text or not text.strip():
@@ -133,34 +179,68 @@ def extract_text_from_pdf(
     return result
 
 
-def _extract_with_pdfplumber(file_path: str) -> tuple:
-    """Extract text using pdfplumber (better for multi-column layouts)."""
+def _open_fitz(source: PDFSource):
+    """Open a path or raw bytes with PyMuPDF."""
+    if isinstance(source, str):
+        return fitz.open(source)
+    return fitz.open(stream=source, filetype="pdf")
+
+
+def _as_file(source: PDFSource):
+    """Path as-is, or raw bytes wrapped in a fresh stream for pdfplumber/PyPDF2."""
+    return source if isinstance(source, str) else io.BytesIO(source)
+
+
+def _check_page_limit(num_pages: int) -> None:
+    """Reject documents over MAX_RESUME_PAGES before any text is extracted."""
+    if num_pages > MAX_RESUME_PAGES:
+        raise PDFExtractionError(
+            "PDF_TOO_MANY_PAGES",
+            f"PDF has {num_pages} pages, exceeds limit of {MAX_RESUME_PAGES}"
+        )
+
+
+def _join_pages(page_texts: Iterable[Optional[str]]) -> str:
+    """Join page texts lazily, stopping once MAX_EXTRACTED_TEXT_LENGTH is reached."""
     text_parts = []
-    num_pages = 0
+    running = 0
+    for page_text in page_texts:
+        if page_text:
+            text_parts.append(page_text)
+            running += len(page_text) + 2
+            if running >= MAX_EXTRACTED_TEXT_LENGTH:
+                break
+    return "\n\n".join(text_parts)
+
+
+def _extract_with_pymupdf(source: PDFSource) -> tuple:
+    """Extract text using PyMuPDF (fastest, backed by the MuPDF C engine)."""
+    with closing(_open_fitz(source)) as doc:
+        num_pages = doc.page_count
+        _check_page_limit(num_pages)
+        text = _join_pages(page.get_text("text") for page in doc)
     
-    with pdfplumber.open(file_path) as pdf:
+    return text, num_pages
+
+
+def _extract_with_pdfplumber(source: PDFSource) -> tuple:
+    """Extract text using pdfplumber (layout-aware fallback)."""
+    with pdfplumber.open(_as_file(source)) as pdf:
         num_pages = len(pdf.pages)
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text_parts.append(page_text)
+        _check_page_limit(num_pages)
+        text = _join_pages(page.extract_text() for page in pdf.pages)
     
-    return "\n\n".join(text_parts), num_pages
+    return text, num_pages
 
 
-def _extract_with_pypdf2(file_path: str) -> tuple:
+def _extract_with_pypdf2(source: PDFSource) -> tuple:
     """Extract text using PyPDF2 (fallback method)."""
-    text_parts = []
-    
-    with open(file_path, 'rb') as file:
-        reader = PdfReader(file)
-        num_pages = len(reader.pages)
-        for page in reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text_parts.append(page_text)
+    reader = PdfReader(_as_file(source))
+    num_pages = len(reader.pages)
+    _check_page_limit(num_pages)
+    text = _join_pages(page.extract_text() for page in reader.pages)
     
-    return "\n\n".join(text_parts), num_pages
+    return text, num_pages
 
 
 if __name__ == "__main__":
@@ -10,6 +10,46 @@ from config.logging_config import get_logger
 
 logger = get_logger("text_cleaner")
 
+# Compiled once at import; reused by every call below
+_SPECIAL_CHARS_RE = re.compile(r'[^a-zA-Z0-9\s.,;:!?\-@#$%&*()\[\]{}\'\"]+')
+_SPACES_RE = re.compile(r'[ \t]+')
+# Any ASCII whitespace that _collapse_whitespace would rewrite
+_DIRTY_WHITESPACE_RE = re.compile(r'[\t\r\v\f\x1c-\x1f]|  | \n|\n |\n\n\n')
+
+# Folds accented Latin letters and typographic punctuation to ASCII after NFKC
+_ASCII_FOLD_TABLE = str.maketrans({
+    **{
+        chr(cp): unicodedata.normalize('NFKD', chr(cp)).encode('ascii', 'ignore').decode('ascii')
+        for cp in range(0xC0, 0x180)
+    },
+    'ß': 'ss', 'æ': 'ae', 'Æ': 'AE', 'œ': 'oe', 'Œ': 'OE',
+    'ø': 'o', 'Ø': 'O', 'đ': 'd', 'Đ': 'D', 'ł': 'l', 'Ł': 'L',
+    '\u2018': "'", '\u2019': "'", '\u201c': '"', '\u201d': '"',
+    '\u2013': '-', '\u2014': '-', '\u2022': '',
+})
+
+# Header/footer lines to skip: "Page X of Y", bare page numbers,
+# confidentiality notices and "Resume of X" headers
+_SKIP_RE = re.compile(
+    r'^(?:Page\s+\d+\s*(?:of\s+\d+)?$|\d+\s*$|Confidential\s*$|Resume\s+of\s+)',
+    re.IGNORECASE
+)
+
+# Common section headers, one named group per section; when a header
+# names several sections the earliest group wins
+_SECTION_RE = re.compile(
+    r'(?i)\b(?:'
+    r'(?P<education>education|academic)'
+    r'|(?P<experience>experience|work\s*history|employment)'
+    r'|(?P<skills>skills|technical\s*skills|competencies)'
+    r'|(?P<summary>summary|profile|objective)'
+    r'|(?P<projects>projects|portfolio)'
+    r'|(?P<certifications>certifications?|licenses?)'
+    r'|(?P<awards>awards?|achievements?|honors?)'
+    r')\b'
+)
+_SECTION_PRIORITY = {name: rank for rank, name in enumerate(_SECTION_RE.groupindex)}
+
 
 def clean_text(
     text: str,
@@ -24,7 +64,7 @@ def clean_text(
     Args:
         text: Raw text to clean
         remove_extra_whitespace: Collapse multiple whitespace to single space
-        normalize_unicode: Convert unicode characters to ASCII equivalents
+        normalize_unicode: NFKC-normalize and fold common accents/punctuation to ASCII
         remove_special_chars: Remove non-alphanumeric characters
         lowercase: Convert text to lowercase
         
@@ -36,24 +76,17 @@ def clean_text(
     
     cleaned = text
     
-    # Normalize unicode characters
-    if normalize_unicode:
-        cleaned = unicodedata.normalize('NFKD', cleaned)
-        cleaned = cleaned.encode('ascii', 'ignore').decode('ascii')
+    # Normalize unicode characters (ASCII text is already normalized)
+    if normalize_unicode and not cleaned.isascii():
+        cleaned = unicodedata.normalize('NFKC', cleaned).translate(_ASCII_FOLD_TABLE)
     
     # Remove special characters (keeping letters, numbers, basic punctuation)
     if remove_special_chars:
-        cleaned = re.sub(r'[^a-zA-Z0-9\s.,;:!?\-@#$%&*()\[\]{}\'\"]+', '', cleaned)
-    
-    # Remove extra whitespace
-    if remove_extra_whitespace:
-        # Replace multiple spaces/tabs with single space
-        cleaned = re.sub(r'[ \t]+', ' ', cleaned)
-        # Replace multiple newlines with double newline
-        cleaned = re.sub(r'\n{3,}', '\n\n', cleaned)
-        # Strip leading/trailing whitespace from lines
-        lines = [line.strip() for line in cleaned.split('\n')]
-        cleaned = '\n'.join(lines)
+        cleaned = _SPECIAL_CHARS_RE.sub('', cleaned)
+    
+    # Remove extra whitespace (skipped when a single scan finds nothing to collapse)
+    if remove_extra_whitespace and (not cleaned.isascii() or _DIRTY_WHITESPACE_RE.search(cleaned)):
+        cleaned = _collapse_whitespace(cleaned)
     
     # Convert to lowercase
     if lowercase:
@@ -65,6 +98,26 @@ def clean_text(
     return cleaned
 
 
+def _collapse_whitespace(text: str) -> str:
+    """
+    Collapse spaces/tabs, fold 3+ newlines to a blank line and strip each line.
+    
+    Runs of blank lines are folded while the lines are stripped, so the text
+    is split and joined only once after the space/tab substitution.
+    """
+    out = []
+    blank_run = 0
+    for line in _SPACES_RE.sub(' ', text).split('\n'):
+        if not line:
+            blank_run += 1
+            if blank_run > 1:
+                continue
+        else:
+            blank_run = 0
+        out.append(line.strip())
+    return '\n'.join(out)
+
+
 def remove_headers_footers(text: str) -> str:
     """
     Remove common header/footer patterns from resume text.
@@ -78,19 +131,9 @@ def remove_headers_footers(text: str) -> str:
     lines = text.split('\n')
     cleaned_lines = []
     
-    # Patterns to skip (page numbers, dates, etc.)
-    skip_patterns = [
-        r'^Page\s+\d+\s*(of\s+\d+)?$',  # Page X of Y
-        r'^\d+\s*$',  # Just page numbers
-        r'^Confidential\s*$',  # Confidentiality notices
-        r'^Resume\s+of\s+',  # "Resume of X" headers
-    ]
-    
     for line in lines:
         stripped = line.strip()
-        should_skip = any(re.match(pattern, stripped, re.IGNORECASE) 
-                        for pattern in skip_patterns)
-        if not should_skip:
+        if not _SKIP_RE.match(stripped):
             cleaned_lines.append(line)
     
     return '\n'.join(cleaned_lines)
@@ -108,17 +151,6 @@ def extract_sections(text: str) -> dict:
     """
     sections = {}
     
-    # Common section headers
-    section_patterns = [
-        (r'(?i)\b(education|academic)\b', 'education'),
-        (r'(?i)\b(experience|work\s*history|employment)\b', 'experience'),
-        (r'(?i)\b(skills|technical\s*skills|competencies)\b', 'skills'),
-        (r'(?i)\b(summary|profile|objective)\b', 'summary'),
-        (r'(?i)\b(projects|portfolio)\b', 'projects'),
-        (r'(?i)\b(certifications?|licenses?)\b', 'certifications'),
-        (r'(?i)\b(awards?|achievements?|honors?)\b', 'awards'),
-    ]
-    
     lines = text.split('\n')
     current_section = 'header'
     current_content = []
@@ -126,10 +158,10 @@ def extract_sections(text: str) -> dict:
     for line in lines:
         # Check if line is a section header
         found_section = None
-        for pattern, section_name in section_patterns:
-            if re.search(pattern, line) and len(line.strip()) < 50:
-                found_section = section_name
-                break
+        if len(line.strip()) < 50:
+            found = [match.lastgroup for match in _SECTION_RE.finditer(line)]
+            if found:
+                found_section = min(found, key=_SECTION_PRIORITY.__getitem__)
         
         if found_section:
             # Save previous section
@@ -2,43 +2,222 @@
 Learning Recommender Module
 Generates personalized learning recommendations for missing skills.
 """
-import json
+import heapq
+import re
 import uuid
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+
+try:
+    from orjson import loads as _json_loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    from json import loads as _json_loads
+    ORJSON_AVAILABLE = False
+
+try:
+    import marisa_trie
+    MARISA_TRIE_AVAILABLE = True
+except ImportError:
+    MARISA_TRIE_AVAILABLE = False
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from config.settings import RESOURCES_LAZY
+from src.utils.file_handler import fast_read_bytes
+
 
 # Load learning resources database
 RESOURCES_PATH = Path(__file__).parent.parent.parent / "data" / "datasets" / "learning_resources.json"
 SYNONYMS_PATH = Path(__file__).parent.parent.parent / "data" / "datasets" / "skill_synonyms.json"
 
-_resources_cache = None
-_synonyms_cache = None
+# Sort codes for missing-skill importance; unknown labels sort last
+_IMPORTANCE_ORDER = {'critical': 0, 'preferred': 1, 'nice-to-have': 2}
 
+# Course durations such as "4 weeks" or "6 months"
+_DURATION_RE = re.compile(r'(\d+)\s*(week|month)', re.IGNORECASE)
+
+# Skill classes used to tailor milestone outcomes; when a name matches
+# several classes the first one in _SKILL_CLASS_OUTCOMES wins
+_SKILL_CLASS_RE = re.compile(
+    r'(?P<prog>python|javascript|java|programming)'
+    r'|(?P<ml>machine learning|deep learning|\bml\b|\bai\b)'
+    r'|(?P<fe>react|angular|vue|frontend)'
+    r'|(?P<ops>docker|kubernetes|devops|aws)'
+    r'|(?P<soft>communication|leadership|teamwork)',
+    re.IGNORECASE
+)
+_SKILL_CLASS_OUTCOMES = {
+    'prog': "Write basic {skill} programs",
+    'ml': "Build simple ML models",
+    'fe': "Create interactive web components",
+    'ops': "Deploy applications to cloud",
+    'soft': "Apply {skill} skills in workplace",
+}
 
-def load_learning_resources() -> Dict:
-    """Load learning resources database."""
-    global _resources_cache
-    if _resources_cache is None:
-        if RESOURCES_PATH.exists():
-            with open(RESOURCES_PATH, 'r', encoding='utf-8') as f:
-                _resources_cache = json.load(f)
-        else:
-            _resources_cache = {}
-    return _resources_cache
 
+def _load_json_or_empty(path: Path) -> Dict:
+    """Decode a JSON file, or return an empty dict if it does not exist."""
+    try:
+        return _json_loads(fast_read_bytes(path))
+    except FileNotFoundError:
+        return {}
 
-def load_skill_synonyms() -> Dict:
-    """Load skill synonyms mapping."""
-    global _synonyms_cache
-    if _synonyms_cache is None:
-        if SYNONYMS_PATH.exists():
-            with open(SYNONYMS_PATH, 'r', encoding='utf-8') as f:
-                _synonyms_cache = json.load(f)
+
+# JSON strings and structural characters, enough to find top-level values
+_JSON_TOKEN_RE = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]:,]')
+
+
+def _index_top_level(data: bytes) -> Dict[str, Tuple[int, int]]:
+    """
+    Map each key of a top-level JSON object to its value's byte range.
+    
+    Strings are skipped whole, so braces and commas inside them never
+    count; nested values are only bracket-counted, not decoded.
+    
+    Args:
+        data: Raw JSON document whose root is an object
+        
+    Returns:
+        Dict of key -> (start, end) offsets of the raw value, in file order
+    """
+    offsets = {}
+    depth = 0
+    key = None
+    start = None
+    for match in _JSON_TOKEN_RE.finditer(data):
+        char = data[match.start()]
+        if char == 0x22:  # "
+            if depth == 1 and start is None:
+                key = match.group()
+        elif char == 0x3A:  # :
+            if depth == 1:
+                start = match.end()
+        elif char == 0x2C:  # ,
+            if depth == 1 and start is not None:
+                offsets[_json_loads(key)] = (start, match.start())
+                start = None
+        elif char in b'{[':
+            depth += 1
         else:
-            _synonyms_cache = {}
-    return _synonyms_cache
+            depth -= 1
+            if depth == 0 and start is not None:
+                offsets[_json_loads(key)] = (start, match.start())
+                start = None
+    return offsets
+
+
+class _LazyResources(Mapping):
+    """
+    Read-only resources mapping that decodes one skill entry at a time.
+    
+    The file is scanned once for each top-level key's byte range; a
+    skill's course list is read from that range on first access and cached.
+    """
+    
+    def __init__(self, path: Path):
+        self._path = path
+        self._entries: Dict[str, List[Dict]] = {}
+        self._offsets = _index_top_level(Path(path).read_bytes())
+    
+    def __getitem__(self, key: str) -> List[Dict]:
+        courses = self._entries.get(key)
+        if courses is None:
+            start, end = self._offsets[key]
+            with open(self._path, 'rb') as f:
+                f.seek(start)
+                courses = self._entries[key] = _json_loads(f.read(end - start))
+        return courses
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._offsets
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._offsets)
+    
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+
+def _lower_index(keys: Iterable[str]) -> Dict[str, str]:
+    """Map lowercased keys to the original key; the first key wins on case collisions."""
+    index = {}
+    for key in keys:
+        index.setdefault(key.lower(), key)
+    return index
+
+
+class _TrieIndex(Mapping):
+    """
+    Read-only lowercase-key -> original-key index backed by a marisa-trie.
+    
+    The trie stores the lowered keys compactly and assigns each one a dense
+    id, which indexes a plain list of original keys.
+    """
+    
+    def __init__(self, index: Dict[str, str]):
+        self._trie = marisa_trie.Trie(index)
+        self._originals = [''] * len(self._trie)
+        for lowered, original in index.items():
+            self._originals[self._trie[lowered]] = original
+        # Iteration keeps source order, which the partial-match fallback relies on
+        self._order = tuple(index)
+    
+    def __getitem__(self, key: str) -> str:
+        return self._originals[self._trie[key]]
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._trie
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._order)
+    
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+def _frozen_lower_index(keys: Iterable[str]) -> Mapping:
+    """Read-only lowercase index, trie-backed when marisa-trie is installed."""
+    index = _lower_index(keys)
+    return _TrieIndex(index) if MARISA_TRIE_AVAILABLE else MappingProxyType(index)
+
+
+def _load_tables() -> Tuple:
+    """Load resources and synonyms with their lowercase key indexes, all read-only."""
+    if RESOURCES_LAZY and RESOURCES_PATH.exists():
+        resources = _LazyResources(RESOURCES_PATH)
+    else:
+        resources = MappingProxyType(_load_json_or_empty(RESOURCES_PATH))
+    synonyms = MappingProxyType(_load_json_or_empty(SYNONYMS_PATH))
+    resources_lower = _frozen_lower_index(resources)
+    return resources, synonyms, resources_lower, tuple(resources_lower), _frozen_lower_index(synonyms)
+
+
+# Loaded at import and exposed read-only, so they are safe to share
+_RESOURCES, _SYNONYMS, _RESOURCES_LOWER, _RESOURCES_KEYS_LOWER, _SYNONYMS_LOWER = _load_tables()
+
+
+def load_learning_resources() -> Mapping:
+    """Load learning resources database (read-only view)."""
+    return _RESOURCES
+
+
+def load_skill_synonyms() -> Mapping:
+    """Load skill synonyms mapping (read-only view)."""
+    return _SYNONYMS
+
+
+def reload_resources() -> None:
+    """Re-read resources and synonyms from disk and drop memoized lookups."""
+    global _RESOURCES, _SYNONYMS, _RESOURCES_LOWER, _RESOURCES_KEYS_LOWER, _SYNONYMS_LOWER
+    _RESOURCES, _SYNONYMS, _RESOURCES_LOWER, _RESOURCES_KEYS_LOWER, _SYNONYMS_LOWER = _load_tables()
+    _find_courses_cached.cache_clear()
+    _build_learning_plan.cache_clear()
 
 
 def normalize_skill_name(skill_name: str) -> str:
@@ -51,20 +230,13 @@ def normalize_skill_name(skill_name: str) -> str:
     Returns:
         Normalized skill name
     """
-    synonyms = load_skill_synonyms()
-    
     # Try exact match first
-    if skill_name in synonyms:
-        return synonyms[skill_name]
+    if skill_name in _SYNONYMS:
+        return _SYNONYMS[skill_name]
     
-    # Try case-insensitive match
-    skill_lower = skill_name.lower()
-    for key, value in synonyms.items():
-        if key.lower() == skill_lower:
-            return value
-    
-    # Return original if no match
-    return skill_name
+    # Fall back to case-insensitive match, else return original
+    key = _SYNONYMS_LOWER.get(skill_name.lower())
+    return _SYNONYMS[key] if key is not None else skill_name
 
 
 def find_courses_for_skill(
@@ -81,8 +253,18 @@ def find_courses_for_skill(
         max_courses: Maximum number of courses to return
         
     Returns:
-        List of course dictionaries
+        List of course dictionaries (copies, safe for callers to mutate)
     """
+    return [dict(course) for course in _find_courses_cached(skill_name, difficulty_preference, max_courses)]
+
+
+@lru_cache(maxsize=4096)
+def _find_courses_cached(
+    skill_name: str,
+    difficulty_preference: Optional[str],
+    max_courses: int
+) -> Tuple[Dict, ...]:
+    """Memoized course lookup behind find_courses_for_skill."""
     resources = load_learning_resources()
     
     # Try normalized skill name
@@ -95,22 +277,23 @@ def find_courses_for_skill(
         courses = resources[skill_name]
     else:
         # Try case-insensitive match
-        courses = None
-        for key in resources:
-            if key.lower() == skill_name.lower() or key.lower() == normalized.lower():
-                courses = resources[key]
-                break
+        skill_lower = skill_name.lower()
+        key = _RESOURCES_LOWER.get(skill_lower)
+        if key is None:
+            key = _RESOURCES_LOWER.get(normalized.lower())
         
         # Try partial match
-        if courses is None:
-            for key in resources:
-                if skill_name.lower() in key.lower() or key.lower() in skill_name.lower():
-                    courses = resources[key]
+        if key is None:
+            for key_lower in _RESOURCES_KEYS_LOWER:
+                if skill_lower in key_lower or key_lower in skill_lower:
+                    key = _RESOURCES_LOWER[key_lower]
                     break
+        
+        courses = resources[key] if key is not None else None
     
     # If no match found, return generic fallback
     if courses is None:
-        return [generate_fallback_resource(skill_name)]
+        return (generate_fallback_resource(skill_name),)
     
     # Filter by difficulty if specified
     if difficulty_preference:
@@ -118,11 +301,8 @@ def find_courses_for_skill(
         if filtered:
             courses = filtered
     
-    # Sort by rating (highest first)
-    courses = sorted(courses, key=lambda x: x.get('rating', 0), reverse=True)
-    
-    # Return top courses
-    return courses[:max_courses]
+    # Return top courses by rating (highest first)
+    return tuple(heapq.nlargest(max_courses, courses, key=lambda x: x.get('rating', 0)))
 
 
 def generate_fallback_resource(skill_name: str) -> Dict:
@@ -160,23 +340,54 @@ def generate_learning_recommendations(
     Returns:
         Learning recommendations dictionary
     """
-    # Sort skills by importance
-    importance_order = {'critical': 0, 'preferred': 1, 'nice-to-have': 2}
-    sorted_skills = sorted(
-        missing_skills,
-        key=lambda x: importance_order.get(x.get('importance', 'nice-to-have'), 3)
+    # Only name and importance drive the plan; absent importance is kept as None
+    skills_key = tuple(
+        (skill.get('skill_name', ''), skill.get('importance')) for skill in missing_skills
+    )
+    skills, milestones, estimated_time = _build_learning_plan(
+        skills_key, max_skills, difficulty_preference
     )
     
-    # Take top N skills
-    top_skills = sorted_skills[:max_skills]
+    # Copy the cached plan so callers can mutate it freely
+    skill_recommendations = [
+        {**skill, 'recommended_courses': [dict(c) for c in skill['recommended_courses']]}
+        for skill in skills
+    ]
+    
+    return {
+        'learning_plan_id': str(uuid.uuid4()),
+        'resume_id': resume_id or str(uuid.uuid4()),
+        'job_id': job_id or str(uuid.uuid4()),
+        'timestamp': datetime.now().isoformat(),
+        'total_skills_to_learn': len(skill_recommendations),
+        'estimated_total_time': estimated_time,
+        'skills': skill_recommendations,
+        'learning_path_milestones': [{**m, 'courses': list(m['courses'])} for m in milestones]
+    }
+
+
+@lru_cache(maxsize=1024)
+def _build_learning_plan(
+    skills_key: Tuple[Tuple[str, Optional[str]], ...],
+    max_skills: int,
+    difficulty_preference: str
+) -> Tuple[Tuple[Dict, ...], Tuple[Dict, ...], str]:
+    """Memoized skill plan, milestones and duration behind generate_learning_recommendations."""
+    # Take the top N skills by importance; the stable sort keeps input order on ties
+    codes = np.fromiter(
+        (_IMPORTANCE_ORDER.get('nice-to-have' if imp is None else imp, 3) for _, imp in skills_key),
+        dtype=np.int8,
+        count=len(skills_key)
+    )
+    top_skills = [skills_key[i] for i in np.argsort(codes, kind='stable')[:max_skills]]
     
     # Generate recommendations for each skill
     skill_recommendations = []
     total_duration_weeks = 0
     
-    for skill_info in top_skills:
-        skill_name = skill_info.get('skill_name', '')
-        importance = skill_info.get('importance', 'preferred')
+    for skill_name, importance in top_skills:
+        if importance is None:
+            importance = 'preferred'
         
         courses = find_courses_for_skill(skill_name, difficulty_preference)
         
@@ -200,19 +411,10 @@ def generate_learning_recommendations(
         
         # Estimate duration
         if courses and not courses[0].get('is_fallback'):
-            duration = courses[0].get('duration', '')
-            if 'week' in duration.lower():
-                try:
-                    weeks = int(''.join(filter(str.isdigit, duration.split()[0])))
-                    total_duration_weeks += weeks
-                except:
-                    total_duration_weeks += 4
-            elif 'month' in duration.lower():
-                try:
-                    months = int(''.join(filter(str.isdigit, duration.split()[0])))
-                    total_duration_weeks += months * 4
-                except:
-                    total_duration_weeks += 4
+            match = _DURATION_RE.search(courses[0].get('duration', ''))
+            if match:
+                amount = int(match.group(1))
+                total_duration_weeks += amount * 4 if match.group(2).lower() == 'month' else amount
             else:
                 total_duration_weeks += 2
     
@@ -227,16 +429,7 @@ def generate_learning_recommendations(
     else:
         estimated_time = f"{total_duration_weeks // 4} months"
     
-    return {
-        'learning_plan_id': str(uuid.uuid4()),
-        'resume_id': resume_id or str(uuid.uuid4()),
-        'job_id': job_id or str(uuid.uuid4()),
-        'timestamp': datetime.now().isoformat(),
-        'total_skills_to_learn': len(skill_recommendations),
-        'estimated_total_time': estimated_time,
-        'skills': skill_recommendations,
-        'learning_path_milestones': milestones
-    }
+    return tuple(skill_recommendations), tuple(milestones), estimated_time
 
 
 def generate_learning_milestones(skill_recommendations: List[Dict]) -> List[Dict]:
@@ -258,17 +451,11 @@ def generate_learning_milestones(skill_recommendations: List[Dict]) -> List[Dict
             }
             
             # Customize outcome based on skill type
-            skill_lower = skill_name.lower()
-            if any(kw in skill_lower for kw in ['python', 'javascript', 'java', 'programming']):
-                milestone['expected_outcome'] = f"Write basic {skill_name} programs"
-            elif any(kw in skill_lower for kw in ['machine learning', 'deep learning', 'ml', 'ai']):
-                milestone['expected_outcome'] = "Build simple ML models"
-            elif any(kw in skill_lower for kw in ['react', 'angular', 'vue', 'frontend']):
-                milestone['expected_outcome'] = "Create interactive web components"
-            elif any(kw in skill_lower for kw in ['docker', 'kubernetes', 'devops', 'aws']):
-                milestone['expected_outcome'] = "Deploy applications to cloud"
-            elif any(kw in skill_lower for kw in ['communication', 'leadership', 'teamwork']):
-                milestone['expected_outcome'] = f"Apply {skill_name} skills in workplace"
+            classes = {match.lastgroup for match in _SKILL_CLASS_RE.finditer(skill_name)}
+            for skill_class, outcome in _SKILL_CLASS_OUTCOMES.items():
+                if skill_class in classes:
+                    milestone['expected_outcome'] = outcome.format(skill=skill_name)
+                    break
             
             milestones.append(milestone)
     
@@ -3,9 +3,16 @@ File Handler Module
 Utilities for file I/O operations.
 """
 import json
+import os
 from pathlib import Path
 from typing import Any, Optional, Union
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from config.logging_config import get_logger
 
 logger = get_logger("file_handler")
@@ -13,10 +20,10 @@ logger = get_logger("file_handler")
 
 def read_file(file_path: Union[str, Path], encoding: str = 'utf-8') -> str:
     """Read text file contents."""
-    path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-    return path.read_text(encoding=encoding)
+    try:
+        return Path(file_path).read_text(encoding=encoding)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
 
 
 def write_file(file_path: Union[str, Path], content: str, encoding: str = 'utf-8') -> None:
@@ -27,13 +34,32 @@ def write_file(file_path: Union[str, Path], content: str, encoding: str = 'utf-8
     logger.info(f"Written file: {file_path}")
 
 
-def read_json(file_path: Union[str, Path]) -> Any:
-    """Read JSON file."""
-    path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+def fast_read_bytes(file_path: Union[str, Path]) -> bytes:
+    """Read a whole file with one open/fstat/read, bypassing pathlib and buffered IO."""
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        # Regular files return everything at once; loop only for short reads
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+def read_json(file_path: Union[str, Path], fast: bool = True) -> Any:
+    """Read JSON file (decoded with orjson when available and fast=True)."""
+    try:
+        if fast and ORJSON_AVAILABLE:
+            return orjson.loads(fast_read_bytes(file_path))
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
 
 
 def write_json(file_path: Union[str, Path], data: Any, indent: int = 2) -> None:
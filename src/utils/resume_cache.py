@@ -0,0 +1,147 @@
+"""
+Resume Cache Module
+On-disk cache of processed resumes, keyed by a hash of the PDF bytes.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Union
+
+from config.settings import (
+    RESUME_CACHE_DIR,
+    RESUME_CACHE_ENABLED,
+    RESUME_CACHE_MAX_AGE_HOURS,
+    RESUME_CACHE_MAX_ENTRIES,
+    SPACY_MODEL
+)
+from config.logging_config import get_logger
+
+logger = get_logger("resume_cache")
+
+# Bump when the pickled Resume layout or processing steps change
+CACHE_VERSION = 1
+
+
+def content_key(data: bytes) -> str:
+    """
+    Cache key for a resume's PDF bytes.
+
+    The vectorizer model and CACHE_VERSION are mixed into the digest so
+    entries built with a different model or pipeline are never reused.
+
+    Args:
+        data: Raw PDF bytes
+
+    Returns:
+        32-character hex digest
+    """
+    hasher = hashlib.blake2b(data, digest_size=16)
+    hasher.update(f"{SPACY_MODEL}:{CACHE_VERSION}".encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def load_resume(key: str, cache_dir: Union[str, Path, None] = None):
+    """
+    Load a cached processed resume.
+
+    Args:
+        key: Key from content_key()
+        cache_dir: Cache directory (defaults to RESUME_CACHE_DIR)
+
+    Returns:
+        Cached Resume object, or None on a miss or unreadable entry
+    """
+    if not RESUME_CACHE_ENABLED:
+        return None
+
+    path = Path(cache_dir or RESUME_CACHE_DIR) / f"{key}.pkl"
+    try:
+        with open(path, 'rb') as f:
+            if _is_expired(os.fstat(f.fileno()).st_mtime, time.time()):
+                f.close()
+                _unlink_quietly(path)
+                return None
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable resume cache entry {key}: {e}")
+        return None
+
+
+def store_resume(key: str, resume, cache_dir: Union[str, Path, None] = None) -> None:
+    """
+    Store a processed resume in the cache.
+
+    The entry is written to a temp file and renamed into place so
+    concurrent workers never read a partial pickle. Expired entries and
+    the oldest ones beyond RESUME_CACHE_MAX_ENTRIES are then pruned.
+    Failures are logged and otherwise ignored.
+
+    Args:
+        key: Key from content_key()
+        resume: Processed Resume object
+        cache_dir: Cache directory (defaults to RESUME_CACHE_DIR)
+    """
+    if not RESUME_CACHE_ENABLED:
+        return
+
+    directory = Path(cache_dir or RESUME_CACHE_DIR)
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(resume, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, directory / f"{key}.pkl")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        prune_cache(directory)
+    except Exception as e:
+        logger.warning(f"Could not write resume cache entry {key}: {e}")
+
+
+def prune_cache(cache_dir: Union[str, Path, None] = None) -> int:
+    """
+    Delete expired entries, then the oldest ones beyond the size limit.
+    
+    Args:
+        cache_dir: Cache directory (defaults to RESUME_CACHE_DIR)
+        
+    Returns:
+        Number of entries deleted
+    """
+    now = time.time()
+    entries = []
+    for path in Path(cache_dir or RESUME_CACHE_DIR).glob("*.pkl"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except FileNotFoundError:
+            continue
+    
+    # Newest first, so everything past the limit is the oldest
+    entries.sort(key=lambda entry: entry[0], reverse=True)
+    stale = [
+        path for i, (mtime, path) in enumerate(entries)
+        if i >= RESUME_CACHE_MAX_ENTRIES or _is_expired(mtime, now)
+    ]
+    for path in stale:
+        _unlink_quietly(path)
+    return len(stale)
+
+
+def _is_expired(mtime: float, now: float) -> bool:
+    """Whether an entry written at mtime is past RESUME_CACHE_MAX_AGE_HOURS."""
+    return now - mtime > RESUME_CACHE_MAX_AGE_HOURS * 3600
+
+
+def _unlink_quietly(path: Path) -> None:
+    """Delete a cache file, ignoring one already removed by another worker."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
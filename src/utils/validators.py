@@ -2,11 +2,15 @@
 Validators Module
 Input validation utilities.
 """
+import os
+import re
 from pathlib import Path
 from typing import Tuple
 
 from config.settings import MAX_FILE_SIZE_BYTES, MAX_RESUME_PAGES, MIN_TEXT_LENGTH
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 
 def validate_pdf(file_path: str) -> Tuple[bool, str]:
     """
@@ -20,13 +24,14 @@ def validate_pdf(file_path: str) -> Tuple[bool, str]:
     """
     path = Path(file_path)
     
-    if not path.exists():
+    try:
+        file_size = os.stat(path).st_size
+    except FileNotFoundError:
         return False, "PDF_FILE_NOT_FOUND: File does not exist"
     
     if not path.suffix.lower() == '.pdf':
         return False, "INVALID_FILE_TYPE: File must be a PDF"
     
-    file_size = path.stat().st_size
     if file_size > MAX_FILE_SIZE_BYTES:
         return False, f"PDF_TOO_LARGE: File exceeds {MAX_FILE_SIZE_BYTES / (1024*1024):.1f}MB limit"
     
@@ -55,9 +60,7 @@ def validate_text_length(text: str, min_length: int = MIN_TEXT_LENGTH) -> Tuple[
 
 def validate_email(email: str) -> bool:
     """Validate email format."""
-    import re
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return _EMAIL_RE.match(email) is not None
 
 
 def validate_skills_list(skills: list) -> Tuple[bool, str]:
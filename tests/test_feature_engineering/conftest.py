@@ -0,0 +1,13 @@
+"""Shared fixtures for feature engineering tests."""
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+@pytest.fixture(scope="session")
+def skill_synonyms():
+    """Skill synonyms mapping, loaded once per test session."""
+    from src.feature_engineering.skill_extractor import load_skill_synonyms
+    return load_skill_synonyms()
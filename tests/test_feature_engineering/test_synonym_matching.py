@@ -14,19 +14,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 class TestSynonymLoading:
     """Test synonym file loading."""
 
-    def test_load_skill_synonyms(self):
+    def test_load_skill_synonyms(self, skill_synonyms):
         """Verify synonyms load successfully."""
-        from src.feature_engineering.skill_extractor import load_skill_synonyms
-        
-        synonyms = load_skill_synonyms()
+        synonyms = skill_synonyms
         assert isinstance(synonyms, dict)
         assert len(synonyms) > 0, "Synonyms file should have entries"
 
-    def test_synonym_has_common_mappings(self):
+    def test_synonym_has_common_mappings(self, skill_synonyms):
         """Check expected mappings exist."""
-        from src.feature_engineering.skill_extractor import load_skill_synonyms
-        
-        synonyms = load_skill_synonyms()
+        synonyms = skill_synonyms
         # These are in skill_synonyms.json
         assert synonyms.get("JS") == "JavaScript"
         assert synonyms.get("K8s") == "Kubernetes"
@@ -36,25 +32,32 @@ class TestSynonymLoading:
 class TestSynonymNormalization:
     """Test text normalization via synonyms."""
 
-    def test_normalize_expands_abbreviations(self):
+    def test_normalize_expands_abbreviations(self, skill_synonyms):
         """JS in text should result in JavaScript being appended."""
         from src.feature_engineering.skill_extractor import normalize_text_with_synonyms
         
         text = "Experienced developer with JS and K8s skills."
-        normalized = normalize_text_with_synonyms(text)
+        normalized = normalize_text_with_synonyms(text, skill_synonyms)
         
         assert "JavaScript" in normalized
         assert "Kubernetes" in normalized
 
-    def test_normalize_preserves_original(self):
+    def test_normalize_preserves_original(self, skill_synonyms):
         """Original text should remain untouched."""
         from src.feature_engineering.skill_extractor import normalize_text_with_synonyms
         
         text = "Python developer with React experience."
-        normalized = normalize_text_with_synonyms(text)
+        normalized = normalize_text_with_synonyms(text, skill_synonyms)
         
         assert "Python developer with React experience." in normalized
 
+    def test_normalize_respects_word_boundaries(self, skill_synonyms):
+        """Variants embedded in longer words should not expand."""
+        from src.feature_engineering.skill_extractor import normalize_text_with_synonyms
+        
+        assert "JavaScript" not in normalize_text_with_synonyms("Parsed JSON payloads.", skill_synonyms)
+        assert "JavaScript" in normalize_text_with_synonyms("Wrote js/TS daily.", skill_synonyms)
+
     def test_normalize_handles_empty(self):
         """Empty text should return empty."""
         from src.feature_engineering.skill_extractor import normalize_text_with_synonyms
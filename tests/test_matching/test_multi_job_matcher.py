@@ -5,6 +5,8 @@ import pytest
 import sys
 from pathlib import Path
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
@@ -110,6 +112,19 @@ class TestMultiJobMatcher:
         with pytest.raises(ValueError, match="missing 'title'"):
             compare_resume_to_jobs(resume, jobs)
     
+    def test_ndarray_vector_matches_list_vector(self):
+        """Test that an ndarray resume vector scores the same as the list form."""
+        from src.matching.multi_job_matcher import compare_resume_to_jobs
+        
+        resume = create_mock_resume()
+        from_list = compare_resume_to_jobs(resume, create_mock_jobs())
+        
+        resume['vector_representation'] = np.asarray(resume['vector_representation'], dtype=np.float32)
+        from_array = compare_resume_to_jobs(resume, create_mock_jobs())
+        
+        assert [r['job_title'] for r in from_array['results']] == [r['job_title'] for r in from_list['results']]
+        assert [r['overall_score'] for r in from_array['results']] == [r['overall_score'] for r in from_list['results']]
+    
     def test_format_comparison_table(self):
         """Test table formatting function."""
         from src.matching.multi_job_matcher import format_comparison_table
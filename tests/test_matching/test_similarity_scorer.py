@@ -26,6 +26,75 @@ def test_similarity_scorer():
     assert 'Python' in result['matched_skills']
 
 
+def test_skill_match_synonyms_and_case():
+    """Test skills match on canonical synonyms or case-insensitive names."""
+    from src.matching.similarity_scorer import calculate_skill_match
+    
+    required_skills = [
+        {'skill_name': 'Machine Learning', 'importance': 'critical'},
+        {'skill_name': 'python', 'importance': 'preferred'},
+        {'skill_name': 'AWS', 'importance': 'nice-to-have'}
+    ]
+    
+    assert calculate_skill_match(['ML', 'Python'], required_skills)[1] == ['Machine Learning', 'python']
+    assert calculate_skill_match(['PYTHON', 'aws'], required_skills)[1] == ['python', 'AWS']
+    
+    score, matched, missing = calculate_skill_match(['Docker'], required_skills)
+    assert score == 0.0 and matched == []
+    assert [m['skill_name'] for m in missing] == ['Machine Learning', 'python', 'AWS']
+    assert calculate_skill_match([], required_skills)[0] == 0.0
+
+
+def test_skill_soa_round_trip():
+    """Test skill dicts convert to parallel arrays and back."""
+    from src.matching._skill_soa import SkillSoA
+    
+    skills = [
+        {'skill_name': 'Python', 'importance': 'critical', 'confidence': 0.9},
+        {'skill_name': 'AWS', 'importance': 'nice-to-have'},
+        {'skill_name': 'Docker'}
+    ]
+    soa = SkillSoA.from_dicts(skills)
+    
+    assert len(soa) == 3
+    assert soa.weights.tolist() == [1.0, 0.3, 0.6]
+    assert [d['importance'] for d in soa.to_dicts()] == ['critical', 'nice-to-have', 'preferred']
+    assert soa.to_dicts()[0]['confidence'] == pytest.approx(0.9)
+
+
+def test_cosine_kernels():
+    """Test cosine kernels agree with the NumPy definition."""
+    from src.matching._kernels import cosine, cosine_batch, _cosine
+    
+    q = np.random.randn(300)
+    M = np.random.randn(4, 300)
+    M[2] = 0.0
+    expected = [0.0 if not row.any() else np.dot(q, row) / (np.linalg.norm(q) * np.linalg.norm(row)) for row in M]
+    
+    assert np.allclose(cosine_batch(q, M), expected)
+    assert cosine(q, M[0]) == pytest.approx(expected[0])
+    assert _cosine(q, M[1]) == pytest.approx(expected[1])
+    assert cosine(q, M[2]) == 0.0
+
+
+def test_semantic_similarities_match_single_scores():
+    """Test batched job similarities agree with calculate_match_score."""
+    from src.matching.similarity_scorer import calculate_match_score, calculate_semantic_similarities
+    
+    resume_vec = np.random.randn(300)
+    job_vecs = [np.random.randn(300) for _ in range(3)]
+    
+    sims = calculate_semantic_similarities(resume_vec, job_vecs)
+    
+    assert sims.shape == (3,)
+    for job_vec, sim in zip(job_vecs, sims):
+        single = calculate_match_score(resume_vec, job_vec, [], [])
+        assert single['subscores']['semantic_similarity'] == pytest.approx(round(sim, 3), abs=1e-3)
+    
+    with pytest.raises(ValueError, match="INVALID_VECTOR_DIMENSION"):
+        calculate_semantic_similarities(resume_vec, [np.random.randn(10)])
+
+
 def test_recommendation_thresholds():
     """Test recommendation mapping."""
     from src.matching.similarity_scorer import get_recommendation
@@ -34,6 +103,18 @@ def test_recommendation_thresholds():
     assert get_recommendation(0.60) == 'good-match'
     assert get_recommendation(0.40) == 'weak-match'
     assert get_recommendation(0.20) == 'no-match'
+    
+    # Thresholds are inclusive and out-of-range scores are clamped
+    assert get_recommendation(0.75) == 'strong-match'
+    assert get_recommendation(0.549) == 'weak-match'
+    assert get_recommendation(0.35) == 'weak-match'
+    assert get_recommendation(1.5) == 'strong-match'
+    assert get_recommendation(-0.1) == 'no-match'
+    
+    # Non-finite scores never raise
+    assert get_recommendation(float('nan')) == 'no-match'
+    assert get_recommendation(float('-inf')) == 'no-match'
+    assert get_recommendation(float('inf')) == 'strong-match'
 
 
 def test_explainer():
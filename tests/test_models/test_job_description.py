@@ -0,0 +1,63 @@
+"""
+Tests for JobDescription model
+"""
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+class TestJobDescription:
+    """Test cases for skill name helpers."""
+    
+    def test_critical_skills(self):
+        """Only critical skills should be returned."""
+        from src.models import JobDescription
+        
+        job = JobDescription(required_skills=[
+            {'skill_name': 'Python', 'importance': 'critical'},
+            {'skill_name': 'AWS', 'importance': 'preferred'}
+        ])
+        
+        assert job.get_critical_skills() == ['Python']
+        assert job.get_all_skill_names() == ['Python', 'AWS']
+    
+    def test_add_skill_is_reflected(self):
+        """Adding a skill should be reflected in subsequent lookups."""
+        from src.models import JobDescription
+        
+        job = JobDescription()
+        assert job.get_critical_skills() == []
+        
+        job.add_skill('Docker', importance='critical')
+        
+        assert job.get_critical_skills() == ['Docker']
+        assert 'Docker' in job.get_all_skill_names()
+    
+    def test_direct_mutation_is_reflected(self):
+        """Appending to required_skills directly should not return stale names."""
+        from src.models import JobDescription
+        
+        job = JobDescription.from_dict({'required_skills': []})
+        assert job.get_all_skill_names() == []
+        
+        job.required_skills.append({'skill_name': 'Rust', 'importance': 'critical'})
+        
+        assert job.get_critical_skills() == ['Rust']
+        assert job.get_all_skill_names() == ['Rust']
+    
+    def test_from_dict_interns_skill_strings(self):
+        """Decoded skill strings should share one interned object."""
+        import json
+        from src.models import JobDescription
+        
+        data = json.loads('{"required_skills": [{"skill_name": "Go", "importance": "critical"}]}')
+        job = JobDescription.from_dict(data)
+        
+        assert job.required_skills[0]['importance'] is sys.intern('critical')
+        assert job.get_critical_skills() == ['Go']
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,78 @@
+"""
+Tests for model serialization
+"""
+import json
+import pytest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+class TestModelSerialization:
+    """Test cases for to_dict/to_json."""
+    
+    def test_resume_to_json_matches_to_dict(self):
+        """to_json should encode the same content as to_dict."""
+        from src.models import Resume
+        
+        resume = Resume(name="John Doe", vector_representation=np.full(300, 0.5))
+        
+        decoded = json.loads(resume.to_json())
+        assert decoded == resume.to_dict()
+        assert len(decoded['vector_representation']) == 300
+    
+    def test_resume_to_dict_without_vector(self):
+        """Missing vector should serialize as None."""
+        from src.models import Resume
+        
+        resume = Resume(name="Jane Doe")
+        
+        assert resume.to_dict()['vector_representation'] is None
+        assert json.loads(resume.to_json())['vector_representation'] is None
+    
+    def test_job_description_to_json(self):
+        """Job description vector should survive a JSON round-trip."""
+        from src.models import JobDescription
+        
+        job = JobDescription(title="Developer", vector_representation=np.arange(300, dtype=np.float64))
+        
+        restored = JobDescription.from_dict(json.loads(job.to_json()))
+        assert np.allclose(restored.vector_representation, job.vector_representation)
+    
+    def test_match_result_to_json(self):
+        """Match result should serialize subscores."""
+        from src.models import MatchResult
+        
+        result = MatchResult(overall_score=0.8123, recommendation='strong-match')
+        
+        decoded = json.loads(result.to_json())
+        assert decoded['overall_score'] == 0.812
+        assert decoded['recommendation'] == 'strong-match'
+    
+    def test_match_result_recommendation_code(self):
+        """Recommendation labels should be parsed into ordered codes."""
+        from src.models import MatchResult, Recommendation
+        
+        result = MatchResult.from_dict({'recommendation': 'good-match'})
+        
+        assert result.recommendation is Recommendation.GOOD
+        assert result.is_acceptable() and not result.is_strong_match()
+        assert result.to_dict()['recommendation'] == 'good-match'
+    
+    def test_match_result_unknown_recommendation(self):
+        """Unknown labels should keep the neutral emoji rather than no-match's."""
+        from src.models import MatchResult, Recommendation
+        
+        result = MatchResult(recommendation='maybe')
+        
+        assert result.recommendation is Recommendation.UNKNOWN
+        assert result.get_recommendation_emoji() == '⚪'
+        assert not result.is_acceptable()
+        assert MatchResult(recommendation='no-match').get_recommendation_emoji() == '🔴'
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -30,6 +30,98 @@ class TestBatchProcessor:
         with pytest.raises(ValueError, match="Maximum 10 resumes"):
             batch_process_resumes(files, job)
     
+    def test_batch_process_ranks_resumes(self, tmp_path, monkeypatch):
+        """Test that extracted resumes are vectorized, matched and ranked."""
+        from pipeline.screening_pipeline import ScreeningPipeline
+        from src.models import Resume
+        from src.pipeline.batch_processor import batch_process_resumes
+        
+        texts = {
+            'strong.pdf': 'Senior Python developer with Machine Learning and AWS experience.',
+            'weak.pdf': 'Retail sales associate with customer service background.'
+        }
+        skills = {
+            'strong.pdf': [{'skill_name': 'Python'}, {'skill_name': 'AWS'}],
+            'weak.pdf': []
+        }
+        
+        def fake_extract(self, pdf_path):
+            name = Path(pdf_path).name
+            return Resume(name=name, extracted_text=texts[name], skills=skills[name])
+        
+        monkeypatch.setattr(ScreeningPipeline, 'extract_resume', fake_extract)
+        
+        files = []
+        for name in texts:
+            path = tmp_path / name
+            path.write_bytes(b'%PDF-1.4')
+            files.append(str(path))
+        files.append(str(tmp_path / 'missing.pdf'))
+        
+        job = {
+            'title': 'Python Developer',
+            'description': 'Python developer with AWS and Machine Learning experience needed.'
+        }
+        result = batch_process_resumes(files, job)
+        
+        assert result['successfully_processed'] == 2
+        assert result['failed_resumes'][0]['error_code'] == 'FILE_NOT_FOUND'
+        assert [r['filename'] for r in result['results']] == ['strong.pdf', 'weak.pdf']
+        assert [r['rank'] for r in result['results']] == [1, 2]
+    
+    def test_batch_failures_stay_per_file(self, tmp_path, monkeypatch):
+        """Test that vectorizer and job failures are reported per file, not raised."""
+        from pipeline.screening_pipeline import ScreeningPipeline
+        from src.models import Resume
+        from src.pipeline import batch_processor
+        
+        monkeypatch.setattr(batch_processor, 'BATCH_MAX_WORKERS', 1)
+        monkeypatch.setattr(
+            ScreeningPipeline, 'extract_resume',
+            lambda self, pdf_path: Resume(name=Path(pdf_path).name, extracted_text=Path(pdf_path).stem)
+        )
+        real_vectorize = ScreeningPipeline.vectorize_resumes
+        
+        def flaky_vectorize(self, resumes):
+            if any(r.extracted_text == 'bad' for r in resumes):
+                raise RuntimeError("vectorizer failed")
+            real_vectorize(self, resumes)
+        
+        monkeypatch.setattr(ScreeningPipeline, 'vectorize_resumes', flaky_vectorize)
+        
+        files = []
+        for name in ('good.pdf', 'bad.pdf'):
+            path = tmp_path / name
+            path.write_bytes(b'%PDF-1.4')
+            files.append(str(path))
+        job = {'title': 'Developer', 'description': 'Python developer needed for backend work.'}
+        
+        result = batch_processor.batch_process_resumes(files, job)
+        assert [r['filename'] for r in result['results']] == ['good.pdf']
+        assert [f['filename'] for f in result['failed_resumes']] == ['bad.pdf']
+        
+        def broken_job(self, *args, **kwargs):
+            raise RuntimeError("job failed")
+        
+        monkeypatch.setattr(ScreeningPipeline, 'process_job_description', broken_job)
+        result = batch_processor.batch_process_resumes(files, job)
+        assert result['results'] == []
+        assert sorted(f['filename'] for f in result['failed_resumes']) == ['bad.pdf', 'good.pdf']
+    
+    def test_to_records_ranks_columns(self):
+        """Test column-oriented results convert to ranked dicts."""
+        import numpy as np
+        from src.pipeline.batch_processor import RESULT_COLUMNS, to_records
+        
+        columns = {name: [None, None] for name in RESULT_COLUMNS}
+        columns['candidate_name'] = ['Bob', 'Alice']
+        columns['overall_score'] = [0.4, 0.9]
+        
+        records = to_records(columns, np.array([1, 0]))
+        
+        assert [r['candidate_name'] for r in records] == ['Alice', 'Bob']
+        assert [r['rank'] for r in records] == [1, 2]
+    
     def test_export_csv_format(self):
         """Test CSV export format."""
         from src.pipeline.batch_processor import export_batch_results_csv
@@ -55,6 +147,20 @@ class TestBatchProcessor:
         assert 'John Doe' in csv
         assert '85' in csv or '0.85' in csv
     
+    def test_export_csv_escapes_fields(self):
+        """Test CSV export quotes commas and quotes inside fields."""
+        import csv
+        import io
+        from src.pipeline.batch_processor import export_batch_results_csv
+        
+        mock_result = {'results': [{'rank': 1, 'candidate_name': 'Doe, "JD" John', 'overall_score': 0.5}]}
+        
+        rows = list(csv.reader(io.StringIO(export_batch_results_csv(mock_result))))
+        
+        assert len(rows) == 2
+        assert rows[1][1] == 'Doe, "JD" John'
+        assert rows[1][4] == '50.00%'
+    
     def test_get_batch_statistics(self):
         """Test statistics calculation."""
         from src.pipeline.batch_processor import get_batch_statistics
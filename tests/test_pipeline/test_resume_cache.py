@@ -0,0 +1,105 @@
+"""
+Tests for the processed-resume cache
+"""
+import pytest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+class TestResumeCache:
+    """Test cases for the content-hash resume cache."""
+
+    def test_content_key_depends_on_bytes(self):
+        """Test that identical bytes share a key and different bytes do not."""
+        from src.utils.resume_cache import content_key
+
+        assert content_key(b'%PDF-1.4 a') == content_key(b'%PDF-1.4 a')
+        assert content_key(b'%PDF-1.4 a') != content_key(b'%PDF-1.4 b')
+        assert len(content_key(b'')) == 32
+
+    def test_store_and_load_round_trip(self, tmp_path):
+        """Test that a stored resume loads back with its vector."""
+        from src.models import Resume
+        from src.utils.resume_cache import load_resume, store_resume
+
+        resume = Resume(name='Jane Doe', vector_representation=np.ones(300, dtype=np.float32))
+        store_resume('abc', resume, cache_dir=tmp_path)
+
+        loaded = load_resume('abc', cache_dir=tmp_path)
+        assert loaded.name == 'Jane Doe'
+        assert np.array_equal(loaded.vector_representation, resume.vector_representation)
+        assert load_resume('missing', cache_dir=tmp_path) is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        """Test that an unreadable entry is ignored instead of raising."""
+        from src.utils.resume_cache import load_resume
+
+        (tmp_path / 'bad.pkl').write_bytes(b'not a pickle')
+        assert load_resume('bad', cache_dir=tmp_path) is None
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        """Test that entries past the age limit are deleted on load."""
+        import os
+        from src.models import Resume
+        from src.utils.resume_cache import load_resume, store_resume
+
+        store_resume('old', Resume(name='Jane Doe'), cache_dir=tmp_path)
+        os.utime(tmp_path / 'old.pkl', (0, 0))
+
+        assert load_resume('old', cache_dir=tmp_path) is None
+        assert not (tmp_path / 'old.pkl').exists()
+
+    def test_prune_keeps_newest_entries(self, tmp_path, monkeypatch):
+        """Test that the cache is trimmed to the newest RESUME_CACHE_MAX_ENTRIES."""
+        import os
+        import time
+        from src.utils import resume_cache
+
+        monkeypatch.setattr(resume_cache, 'RESUME_CACHE_MAX_ENTRIES', 2)
+        now = time.time()
+        for i, key in enumerate(['a', 'b', 'c']):
+            (tmp_path / f'{key}.pkl').write_bytes(b'')
+            os.utime(tmp_path / f'{key}.pkl', (now - 10 + i, now - 10 + i))
+
+        assert resume_cache.prune_cache(tmp_path) == 1
+        assert sorted(p.stem for p in tmp_path.glob('*.pkl')) == ['b', 'c']
+
+    def test_pipeline_reuses_cached_resume(self, tmp_path, monkeypatch):
+        """Test that process_resume_bytes only extracts a given file once."""
+        import pipeline.screening_pipeline as sp
+        from src.models import Resume
+        from src.utils import resume_cache
+
+        monkeypatch.setattr(resume_cache, 'RESUME_CACHE_DIR', tmp_path)
+
+        calls = []
+
+        def fake_extract(self, data, filename="resume.pdf"):
+            calls.append(filename)
+            return Resume(name='Jane Doe', extracted_text='Python developer', source_file=filename)
+
+        monkeypatch.setattr(sp.ScreeningPipeline, 'extract_resume_bytes', fake_extract)
+        monkeypatch.setattr(sp, 'create_document_vector', lambda text: np.zeros(300, dtype=np.float32))
+
+        pipeline = sp.ScreeningPipeline()
+        first = pipeline.process_resume_bytes(b'%PDF-1.4 same', 'a.pdf')
+        second = pipeline.process_resume_bytes(b'%PDF-1.4 same', 'b.pdf')
+
+        assert calls == ['a.pdf']
+        assert second.name == 'Jane Doe'
+        assert second.source_file == 'b.pdf'
+        assert second.resume_id != first.resume_id
+
+        # Callers that must not persist uploads bypass the cache entirely
+        pipeline.process_resume_bytes(b'%PDF-1.4 private', 'c.pdf', use_cache=False)
+        pipeline.process_resume_bytes(b'%PDF-1.4 private', 'c.pdf', use_cache=False)
+        assert calls == ['a.pdf', 'c.pdf', 'c.pdf']
+        assert len(list(tmp_path.glob('*.pkl'))) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,79 @@
+"""
+Tests for the Screening Pipeline
+"""
+import pytest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+class TestScreeningPipeline:
+    """Test cases for end-to-end screening."""
+
+    def test_streaming_yields_stages_in_order(self, tmp_path, monkeypatch):
+        """Test that streaming screening reports each stage and ends with the full result."""
+        import pipeline.screening_pipeline as sp
+        from src.models import Resume
+        from src.utils import resume_cache
+
+        monkeypatch.setattr(resume_cache, 'RESUME_CACHE_DIR', tmp_path)
+
+        def fake_extract(self, data, filename="resume.pdf"):
+            return Resume(
+                name='Jane Doe',
+                extracted_text='Python developer with SQL',
+                skills=[{'skill_name': 'Python'}, {'skill_name': 'SQL'}],
+                source_file=filename
+            )
+
+        monkeypatch.setattr(sp.ScreeningPipeline, 'extract_resume_bytes', fake_extract)
+        monkeypatch.setattr(sp, 'create_document_vector', lambda text: np.ones(300, dtype=np.float32))
+
+        pipeline = sp.ScreeningPipeline()
+        stages = list(pipeline.screen_resume_bytes_streaming(
+            b'%PDF-1.4 resume', 'Looking for a Python developer who knows SQL', 'Developer', 'cv.pdf'
+        ))
+
+        assert [stage for stage, _ in stages] == ['resume', 'job', 'result']
+        assert stages[0][1].name == 'Jane Doe'
+        assert stages[1][1].title == 'Developer'
+
+        result = stages[2][1]
+        assert set(result) == {'resume', 'job', 'match'}
+        assert 0.0 <= result['match']['overall_score'] <= 1.0
+
+        # The non-streaming entry point returns the same final result
+        again = pipeline.screen_resume_bytes(
+            b'%PDF-1.4 resume', 'Looking for a Python developer who knows SQL', 'Developer', 'cv.pdf'
+        )
+        assert again['match']['overall_score'] == result['match']['overall_score']
+
+    def test_job_batch_matches_single_processing(self, monkeypatch):
+        """Test that batched job processing reuses the batch vectors and single-job construction."""
+        import pipeline.screening_pipeline as sp
+
+        def no_single_vector(text):
+            raise AssertionError("jobs should be vectorized in one batch")
+
+        monkeypatch.setattr(sp, 'create_document_vectors', lambda texts: [np.full(300, i, dtype=np.float32) for i in range(len(texts))])
+        monkeypatch.setattr(sp, 'create_document_vector', no_single_vector)
+
+        pipeline = sp.ScreeningPipeline()
+        jobs = pipeline.process_job_descriptions([
+            {'title': 'Backend', 'company': 'Acme', 'description': 'Python and SQL developer'},
+            {'title': 'Frontend', 'description': 'JavaScript developer'},
+        ])
+
+        assert [job.title for job in jobs] == ['Backend', 'Frontend']
+        assert jobs[0].company == 'Acme' and jobs[1].company is None
+        assert jobs[1].vector_representation[0] == 1.0
+
+        single = pipeline.process_job_description('Python and SQL developer', 'Backend', vector=np.zeros(300))
+        assert jobs[0].required_skills == single.required_skills
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -18,6 +18,60 @@ def test_text_cleaner():
     assert clean_text(None) == ""
 
 
+def test_unicode_normalization():
+    """Test accent folding and compatibility normalization."""
+    from src.preprocessing.text_cleaner import clean_text
+    
+    assert clean_text("José Núñez") == "Jose Nunez"
+    assert clean_text("５ years’ experience") == "5 years' experience"
+
+
+def test_clean_text_fast_paths():
+    """Already-clean ASCII text should pass through unchanged."""
+    from src.preprocessing.text_cleaner import clean_text
+    
+    assert clean_text("Jane Doe\nPython developer\n\nSkills") == "Jane Doe\nPython developer\n\nSkills"
+    assert clean_text("trailing \nspace") == "trailing\nspace"
+
+
+def test_collapse_whitespace_matches_regex():
+    """Single-pass whitespace collapse should match the regex pipeline."""
+    import re
+    from src.preprocessing.text_cleaner import _collapse_whitespace
+    
+    samples = [
+        "Hello    World\n\n\n\nTest",
+        "  a\t\tb  \n \n\n\n c \r\n\n\nd\n",
+        "x\n\ny\n\n\n\n\n\nz",
+        "\n\n\nlead and trail\n\n\n",
+    ]
+    for text in samples:
+        expected = re.sub(r'\n{3,}', '\n\n', re.sub(r'[ \t]+', ' ', text))
+        expected = '\n'.join(line.strip() for line in expected.split('\n'))
+        assert _collapse_whitespace(text).strip() == expected.strip()
+
+
+def test_headers_and_sections():
+    """Test header/footer removal and section detection."""
+    from src.preprocessing.text_cleaner import remove_headers_footers, extract_sections
+    
+    text = "Jane Doe\nPage 1 of 2\n3\nEXPERIENCE\nEngineer at Acme\nSkills\nPython, SQL"
+    cleaned = remove_headers_footers(text)
+    assert "Page 1" not in cleaned
+    assert "\n3\n" not in cleaned
+    
+    sections = extract_sections(cleaned)
+    assert sections == {
+        'header': 'Jane Doe',
+        'experience': 'Engineer at Acme',
+        'skills': 'Python, SQL'
+    }
+    
+    # A header naming several sections keeps the original precedence
+    sections = extract_sections("Skills and Education\nBSc, Python\nProjects & Experience\nAcme")
+    assert sections == {'education': 'BSc, Python', 'experience': 'Acme'}
+
+
 def test_parser_email():
     """Test email extraction."""
     from src.preprocessing.parser import extract_email
@@ -34,6 +88,29 @@ def test_parser_phone():
     phone = extract_phone(text)
     assert phone is not None
     assert "555" in phone
+    
+    # Unicode whitespace (NBSP) still separates the digit groups
+    assert extract_phone("Phone: 555\u00a0123\u00a04567") is not None
+
+
+def test_parser_profile_links():
+    """Test LinkedIn/GitHub extraction ignores URL casing."""
+    from src.preprocessing.parser import extract_linkedin, extract_github
+    
+    text = "https://www.LinkedIn.com/in/jane-doe | GitHub.com/janedoe"
+    assert extract_linkedin(text) == "https://www.LinkedIn.com/in/jane-doe"
+    assert extract_github(text) == "GitHub.com/janedoe"
+    
+    # Profile slugs keep non-ASCII letters
+    assert extract_linkedin("linkedin.com/in/josé-garcía") == "linkedin.com/in/josé-garcía"
+
+
+def test_regex_backend_falls_back_for_unsupported_syntax():
+    """Test patterns RE2 rejects (backreferences) still compile."""
+    from src.preprocessing import _regex
+    
+    assert _regex.compile(r'(\w)\1').search("book").group(0) == "oo"
+    assert _regex.compile(r'[ \t]+').sub(' ', "a \t b") == "a b"
 
 
 def test_parser_name():
@@ -43,3 +120,85 @@ def test_parser_name():
     text = "John Doe\njohn@example.com\n555-1234"
     name = extract_name(text)
     assert name == "John Doe"
+
+
+def test_years_of_experience_scan_matches_regex():
+    """Test the byte scanner agrees with the regex it replaces."""
+    import re
+    import numpy as np
+    from src.preprocessing.parser import _find_yoe, extract_years_of_experience
+    
+    pattern = r'(\d+)\+?\s*years?\s*(?:of\s*)?experience'
+    samples = [
+        "5+ years of experience",
+        "12 years experience in Python",
+        "3 years 4 years experience",
+        "5 + years experience",
+        "6 years of of experience",
+        "300 years of experience",
+        "No experience mentioned",
+    ]
+    
+    for text in samples:
+        match = re.search(pattern, text, re.IGNORECASE)
+        expected = int(match.group(1)) if match else -1
+        buf = np.frombuffer(text.lower().encode('ascii'), dtype=np.uint8)
+        assert _find_yoe(buf) == expected
+    
+    assert extract_years_of_experience("Experience: 7 years") == 7
+
+
+def test_join_pages_stops_at_length_cap():
+    """Page joining should stop consuming pages once the cap is reached."""
+    from config.settings import MAX_EXTRACTED_TEXT_LENGTH
+    from src.preprocessing.pdf_extractor import _join_pages
+    
+    consumed = []
+    
+    def pages():
+        for i in range(10):
+            consumed.append(i)
+            yield "x" * (MAX_EXTRACTED_TEXT_LENGTH // 2)
+    
+    text = _join_pages(pages())
+    
+    assert len(consumed) == 2
+    assert len(text) >= MAX_EXTRACTED_TEXT_LENGTH
+    assert _join_pages(["a", None, "", "b"]) == "a\n\nb"
+
+
+def test_pdf_bytes_size_limit():
+    """In-memory PDFs get the same size check as files on disk."""
+    from config.settings import MAX_FILE_SIZE_BYTES
+    from src.preprocessing.pdf_extractor import PDFExtractionError, extract_text_from_pdf_bytes
+    
+    with pytest.raises(PDFExtractionError) as exc_info:
+        extract_text_from_pdf_bytes(bytearray(MAX_FILE_SIZE_BYTES + 1))
+    
+    assert exc_info.value.error_code == "PDF_TOO_LARGE"
+
+
+def test_pdf_fallback_when_pymupdf_cannot_open(monkeypatch):
+    """A document PyMuPDF rejects still reaches the next extractor, page limits do not."""
+    from src.preprocessing import pdf_extractor
+    from src.preprocessing.pdf_extractor import PDFExtractionError, extract_text_from_pdf_bytes
+    
+    def broken_pymupdf(source):
+        raise RuntimeError("cannot open broken document")
+    
+    monkeypatch.setattr(pdf_extractor, 'PYMUPDF_AVAILABLE', True)
+    monkeypatch.setattr(pdf_extractor, 'PDFPLUMBER_AVAILABLE', True)
+    monkeypatch.setattr(pdf_extractor, '_extract_with_pymupdf', broken_pymupdf)
+    monkeypatch.setattr(pdf_extractor, '_extract_with_pdfplumber', lambda source: ("Jane Doe resume", 1))
+    
+    result = extract_text_from_pdf_bytes(b'%PDF-1.4')
+    assert result["extraction_method"] == "pdfplumber"
+    assert result["text"] == "Jane Doe resume"
+    
+    def long_pymupdf(source):
+        pdf_extractor._check_page_limit(pdf_extractor.MAX_RESUME_PAGES + 1)
+    
+    monkeypatch.setattr(pdf_extractor, '_extract_with_pymupdf', long_pymupdf)
+    with pytest.raises(PDFExtractionError) as exc_info:
+        extract_text_from_pdf_bytes(b'%PDF-1.4')
+    assert exc_info.value.error_code == "PDF_TOO_MANY_PAGES"
@@ -27,6 +27,8 @@ class TestLearningRecommender:
         
         normalized = normalize_skill_name('ML')
         assert normalized == 'Machine Learning'
+        assert normalize_skill_name('ml') == 'Machine Learning'
+        assert normalize_skill_name('Unmapped Skill') == 'Unmapped Skill'
     
     def test_fallback_for_unknown_skill(self):
         """Test fallback for unmapped skills."""
@@ -38,6 +40,69 @@ class TestLearningRecommender:
         assert courses[0].get('is_fallback') == True
         assert 'youtube' in courses[0].get('url', '').lower()
     
+    def test_find_courses_case_insensitive(self):
+        """Test lookups ignore skill name casing."""
+        from src.recommendations.learning_recommender import find_courses_for_skill
+        
+        assert find_courses_for_skill('PYTHON') == find_courses_for_skill('Python')
+    
+    def test_cached_courses_are_copies(self):
+        """Mutating returned courses should not leak into later lookups."""
+        from src.recommendations.learning_recommender import find_courses_for_skill
+        
+        first = find_courses_for_skill('Python')
+        first[0]['why_recommended'] = 'mutated'
+        second = find_courses_for_skill('Python')
+        
+        assert second[0] is not first[0]
+        assert second[0].get('why_recommended') != 'mutated'
+    
+    def test_resources_are_read_only(self):
+        """Test the loaded resources cannot be mutated by callers."""
+        from src.recommendations.learning_recommender import load_learning_resources, reload_resources
+        
+        resources = load_learning_resources()
+        with pytest.raises(TypeError):
+            resources['New Skill'] = []
+        
+        reload_resources()
+        assert load_learning_resources() == resources
+    
+    def test_lazy_resources_mapping(self, tmp_path):
+        """Test the lazy resources mapping decodes entries on demand."""
+        import json
+        from src.recommendations.learning_recommender import _LazyResources
+        
+        catalog = {
+            "Node.js": [{"title": "Node", "rating": 4.5}],
+            "Go": [],
+            "C++ \"pro\"": [{"title": "Braces {, [ and ] in text", "tags": ["a", {"b": 1}]}],
+            "Rust": "see docs",
+        }
+        path = tmp_path / "resources.json"
+        path.write_text(json.dumps(catalog, indent=2), encoding='utf-8')
+        
+        resources = _LazyResources(path)
+        
+        assert list(resources) == list(catalog)
+        assert "Go" in resources and "Zig" not in resources
+        assert resources["Node.js"] == [{"title": "Node", "rating": 4.5}]
+        assert dict(resources) == catalog
+        with pytest.raises(KeyError):
+            resources["Zig"]
+    
+    def test_trie_index_lookup(self):
+        """Test the trie-backed lowercase index resolves original keys."""
+        pytest.importorskip("marisa_trie")
+        from src.recommendations.learning_recommender import _TrieIndex
+        
+        index = _TrieIndex({'node.js': 'Node.js', 'aws': 'AWS'})
+        
+        assert index['aws'] == 'AWS'
+        assert index.get('node.js') == 'Node.js'
+        assert index.get('gcp') is None
+        assert list(index) == ['node.js', 'aws']
+    
     def test_generate_recommendations_structure(self):
         """Test learning recommendations output structure."""
         from src.recommendations.learning_recommender import generate_learning_recommendations
@@ -54,6 +119,20 @@ class TestLearningRecommender:
         assert len(result['skills']) <= 2
         assert 'estimated_total_time' in result
     
+    def test_cached_plans_are_independent(self):
+        """Repeated plans get fresh ids and do not share mutable state."""
+        from src.recommendations.learning_recommender import generate_learning_recommendations
+        
+        missing = [{'skill_name': 'Python', 'importance': 'critical'}]
+        
+        first = generate_learning_recommendations(missing)
+        first['skills'][0]['recommended_courses'][0]['title'] = 'mutated'
+        second = generate_learning_recommendations(missing)
+        
+        assert first['learning_plan_id'] != second['learning_plan_id']
+        assert second['skills'][0]['recommended_courses'][0]['title'] != 'mutated'
+        assert second['skills'] == generate_learning_recommendations(missing)['skills']
+    
     def test_skills_sorted_by_importance(self):
         """Test that skills are sorted by importance."""
         from src.recommendations.learning_recommender import generate_learning_recommendations
@@ -92,6 +171,38 @@ class TestLearningRecommender:
         
         assert 'learning_path_milestones' in result
         assert len(result['learning_path_milestones']) > 0
+    
+    def test_milestone_outcomes_by_skill_class(self):
+        """Test milestone outcomes are tailored to the skill class."""
+        from src.recommendations.learning_recommender import generate_learning_milestones
+        
+        skills = [
+            {'skill_name': name, 'recommended_courses': [{'title': 'Course'}]}
+            for name in ['Python', 'ML', 'HTML']
+        ]
+        outcomes = [m['expected_outcome'] for m in generate_learning_milestones(skills)]
+        
+        assert outcomes == [
+            "Write basic Python programs",
+            "Build simple ML models",
+            "Build foundational knowledge in HTML"
+        ]
+    
+    def test_milestone_outcome_class_priority(self):
+        """Test names matching several classes use the highest-priority class."""
+        from src.recommendations.learning_recommender import generate_learning_milestones
+        
+        skills = [
+            {'skill_name': name, 'recommended_courses': [{'title': 'Course'}]}
+            for name in ['AWS Machine Learning', 'Docker for Python', 'Leadership in DevOps']
+        ]
+        outcomes = [m['expected_outcome'] for m in generate_learning_milestones(skills)]
+        
+        assert outcomes == [
+            "Build simple ML models",
+            "Write basic Docker for Python programs",
+            "Deploy applications to cloud"
+        ]
 
 
 if __name__ == "__main__":
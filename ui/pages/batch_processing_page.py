@@ -2,24 +2,140 @@
 Batch Processing Page
 Process multiple resumes against a single job description with live progress.
 """
+import csv
+import io
+import math
+import numpy as np
 import streamlit as st
-import tempfile
-import os
 import sys
-import pandas as pd
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from html import escape as _esc
+from operator import itemgetter
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from ui.styles import apply_global_styles, get_score_hex
+from config.settings import BATCH_MAX_WORKERS
+from ui.resources import get_pipeline
+from ui.styles import get_score_hex
+
+# Minimum seconds between live progress/status repaints
+_UI_UPDATE_INTERVAL = 0.1
+
+# Fresh extractions vectorized per batch while workers keep extracting
+_VECTORIZE_CHUNK = 8
+
+# Result cards rendered per page of the ranked list
+_RESULTS_PAGE_SIZE = 50
+
+# Result card markup, filled in by display_batch_results
+_RESULT_CARD = """
+<div class="result-card{error_class}" style="animation-delay: {delay}s;">
+
+    <div style="display: flex; align-items: center; gap: 12px;">
+        <div style="font-family: 'JetBrains Mono'; font-size: 13px; color: #64748B; min-width: 24px;">#{rank}</div>
+        <div>
+            <div style="font-size: 14px; font-weight: 500; color: #F1F5F9;">{filename}</div>
+            <div style="font-size: 11px; color: {status_color}; margin-top: 2px;">{status}</div>
+        </div>
+    </div>
+
+    <div style="font-family: 'JetBrains Mono'; font-size: 22px; font-weight: 700; color: {color};">
+        {score_pct}%
+    </div>
+</div>
+"""
+
+
+def _extract_one(args):
+    """
+    Extract one uploaded resume in a worker.
+
+    Cached resumes come back already vectorized; fresh extractions are
+    vectorized together afterwards.
+
+    Args:
+        args: Tuple of (filename, pdf_bytes)
+
+    Returns:
+        Tuple of (Resume or None, error message or None)
+    """
+    filename, pdf_bytes = args
+    try:
+        pipeline = get_pipeline()
+        resume = pipeline.load_cached_resume(pdf_bytes, filename)
+        if resume is None:
+            resume = pipeline.extract_resume_bytes(pdf_bytes, filename)
+        return resume, None
+    except Exception as e:
+        return None, str(e)
+
+
+def _score_one(filename, resume, error, job):
+    """
+    Score one extracted resume against the batch job.
+
+    Args:
+        filename: Uploaded file name
+        resume: Vectorized Resume object, or None if extraction failed
+        error: Extraction error message, if any
+        job: JobDescription processed once for the whole batch
+
+    Returns:
+        Result row with Filename, Score and Status
+    """
+    if resume is not None:
+        try:
+            score = get_pipeline().match_resume_to_job(resume, job).get('overall_score', 0)
+            return {'Filename': filename, 'Score': score, 'Status': 'Completed'}
+        except Exception as e:
+            error = str(e)
+    return {'Filename': filename, 'Score': 0, 'Status': f'Error: {error}'}
+
+
+def _score_batch(tasks, extracted, rows, indices, job):
+    """
+    Vectorize a group of freshly extracted resumes in one batch and score them.
+
+    Args:
+        tasks: List of (filename, pdf_bytes) in upload order
+        extracted: List of (Resume or None, error or None), aligned with tasks
+        rows: Result rows aligned with tasks; filled in place
+        indices: Positions of the extracted resumes still needing vectors
+        job: JobDescription processed once for the whole batch
+    """
+    if not indices:
+        return
+
+    pipeline = get_pipeline()
+    try:
+        pipeline.vectorize_resumes([extracted[i][0] for i in indices])
+    except Exception as e:
+        # Only this chunk fails; rows already scored are kept
+        for i in indices:
+            rows[i] = _score_one(tasks[i][0], None, f"Vectorization failed: {e}", job)
+        return
+
+    for i in indices:
+        pipeline.cache_resume(tasks[i][1], extracted[i][0])
+        rows[i] = _score_one(tasks[i][0], *extracted[i], job)
+
+
+def _render_live_rows(placeholder, rows):
+    """Repaint the live results table with the rows scored so far, best first."""
+    scored = [row for row in rows if row is not None]
+    placeholder.dataframe(
+        sorted(scored, key=itemgetter('Score'), reverse=True),
+        use_container_width=True,
+        hide_index=True
+    )
 
 
 def render_batch_processing_page():
     """Render the batch processing page."""
 
-    apply_global_styles()
-
     # Header
     st.markdown("""
     <div class="page-header">
@@ -75,21 +191,48 @@ def render_batch_processing_page():
             # Progress
             progress_bar = st.progress(0)
             status_container = st.empty()
+            live_results = st.empty()
 
             results = []
 
             try:
-                from pipeline.screening_pipeline import ScreeningPipeline
-                pipeline = ScreeningPipeline()
-
-                total = len(uploaded_files)
+                # The job is processed once; uploads are extracted straight
+                # from memory in parallel and vectorized in batches
+                job = get_pipeline().process_job_description(job_description)
+                tasks = [(file.name, file.getvalue()) for file in uploaded_files]
+
+                total = len(tasks)
+                num_workers = min(total, BATCH_MAX_WORKERS)
+                executor_cls = ProcessPoolExecutor if num_workers > 1 else ThreadPoolExecutor
+
+                # Extractions are slotted back by upload index so score ties keep upload order.
+                # Cache hits arrive vectorized and failures need no scoring, so those rows
+                # are scored (and shown) as they land. Fresh extractions are vectorized here
+                # in chunks while the workers carry on extracting the rest.
+                extracted = [None] * total
+                rows = [None] * total
+                fresh = []
+                with executor_cls(max_workers=num_workers) as executor:
+                    futures = {executor.submit(_extract_one, task): i for i, task in enumerate(tasks)}
+
+                    last_ui = 0.0
+                    for done, future in enumerate(as_completed(futures), start=1):
+                        index = futures[future]
+                        extracted[index] = resume, error = future.result()
+                        if resume is None or resume.vector_representation is not None:
+                            rows[index] = _score_one(tasks[index][0], resume, error, job)
+                        else:
+                            fresh.append(index)
+                            if len(fresh) >= _VECTORIZE_CHUNK and done < total:
+                                _score_batch(tasks, extracted, rows, fresh, job)
+                                fresh = []
+
+                        # Repaint at most every _UI_UPDATE_INTERVAL, always on the last file
+                        now = time.monotonic()
+                        if now - last_ui < _UI_UPDATE_INTERVAL and done < total:
+                            continue
+                        last_ui = now
 
-                for i, file in enumerate(uploaded_files):
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-                        tmp.write(file.getbuffer())
-                        tmp_path = tmp.name
-
-                    try:
                         # Status update
                         status_container.markdown(f"""
                         <div style="display: flex; align-items: center; gap: 12px; padding: 12px 16px;
@@ -97,32 +240,17 @@ def render_batch_processing_page():
                                     margin-bottom: 8px;">
                             <div style="width: 8px; height: 8px; border-radius: 50%; background: #00D9FF;
                                         animation: dotPulse 1s ease infinite;"></div>
-                            <span style="font-size: 14px; color: #94A3B8;">Processing {i+1}/{total}:</span>
-                            <span style="font-size: 14px; color: #F1F5F9; font-weight: 500;">{file.name}</span>
+                            <span style="font-size: 14px; color: #94A3B8;">Processed {done}/{total}:</span>
+                            <span style="font-size: 14px; color: #F1F5F9; font-weight: 500;">{_esc(tasks[index][0])}</span>
                         </div>
                         """, unsafe_allow_html=True)
 
-                        result = pipeline.screen_resume(tmp_path, job_description)
-                        match = result.get('match', {})
-                        score = match.get('overall_score', 0)
-
-                        results.append({
-                            'Filename': file.name,
-                            'Score': score,
-                            'Status': 'Completed'
-                        })
+                        progress_bar.progress(done / total)
+                        _render_live_rows(live_results, rows)
 
-                        progress_bar.progress((i + 1) / total)
-
-                    except Exception as e:
-                        results.append({
-                            'Filename': file.name,
-                            'Score': 0,
-                            'Status': f'Error: {str(e)}'
-                        })
-                    finally:
-                        if os.path.exists(tmp_path):
-                            os.unlink(tmp_path)
+                _score_batch(tasks, extracted, rows, fresh, job)
+                results = rows
+                live_results.empty()
 
                 # Done
                 status_container.markdown("""
@@ -134,67 +262,114 @@ def render_batch_processing_page():
                 </div>
                 """, unsafe_allow_html=True)
 
-                display_batch_results(results)
+                # Rank once here; reruns (paging, export) reuse the stored order
+                st.session_state['batch_results'] = _rank_results(results)
 
             except Exception as e:
                 st.error(f"Batch error: {str(e)}")
+                st.session_state.pop('batch_results', None)
 
+    # Display results if available (persists across reruns, e.g. the export button)
+    if 'batch_results' in st.session_state:
+        display_batch_results(st.session_state['batch_results'])
 
-def display_batch_results(results):
-    """Display batch results with styled cards."""
 
-    st.markdown("""
-    <div class="page-header" style="margin-top: 24px; margin-bottom: 16px;">
-        <h3 style="font-size: 20px;">Results</h3>
-    </div>
-    """, unsafe_allow_html=True)
+def _rank_results(results):
+    """
+    Order result rows by score, best first.
 
-    # Sort by score
-    results_sorted = sorted(results, key=lambda x: x['Score'], reverse=True)
+    Uses a stable argsort so tied scores keep upload order.
 
-    # Result cards
-    for i, r in enumerate(results_sorted):
-        score = r['Score']
-        score_pct = int(score * 100)
-        color = get_score_hex(score)
-        filename = r['Filename']
-        status = r['Status']
+    Args:
+        results: Result rows with Filename, Score and Status
 
-        is_error = status != 'Completed'
+    Returns:
+        New list of the same rows in rank order
+    """
+    scores = np.fromiter((r['Score'] for r in results), dtype=np.float64, count=len(results))
+    return [results[i] for i in np.argsort(-scores, kind='stable')]
 
-        st.markdown(f"""
-        <div style="background: var(--surface); border: 1px solid {'rgba(255,71,87,0.2)' if is_error else 'var(--border)'};
-                    border-radius: 12px; padding: 16px 20px; margin-bottom: 8px;
-                    display: flex; align-items: center; justify-content: space-between;
-                    animation: fadeInUp 0.3s ease both; animation-delay: {i * 0.05}s;
-                    transition: all 0.15s ease;"
-             onmouseover="this.style.borderColor='rgba(148,163,184,0.25)'; this.style.transform='translateY(-1px)';"
-             onmouseout="this.style.borderColor='{'rgba(255,71,87,0.2)' if is_error else 'var(--border)'}'; this.style.transform='translateY(0)';">
-
-            <div style="display: flex; align-items: center; gap: 12px;">
-                <div style="font-family: 'JetBrains Mono'; font-size: 13px; color: #64748B; min-width: 24px;">#{i+1}</div>
-                <div>
-                    <div style="font-size: 14px; font-weight: 500; color: #F1F5F9;">{filename}</div>
-                    <div style="font-size: 11px; color: {'#FF4757' if is_error else '#64748B'}; margin-top: 2px;">{status}</div>
-                </div>
-            </div>
 
-            <div style="font-family: 'JetBrains Mono'; font-size: 22px; font-weight: 700; color: {color};">
-                {score_pct}%
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+def display_batch_results(results):
+    """Display ranked batch results with styled cards."""
 
-    # Export
-    df = pd.DataFrame(results_sorted)
-    csv = df.to_csv(index=False).encode('utf-8')
+    st.markdown("""
+    <div class="page-header" style="margin-top: 24px; margin-bottom: 16px;">
+        <h3 style="font-size: 20px;">Results</h3>
+    </div>
+    """, unsafe_allow_html=True)
 
+    # Only one page of cards is sent to the browser; the full list stays
+    # server-side for the CSV export
+    num_pages = max(1, math.ceil(len(results) / _RESULTS_PAGE_SIZE))
+    page = 1
+    if num_pages > 1:
+        page = st.number_input(
+            f"Page (of {num_pages})", min_value=1, max_value=num_pages, value=1,
+            key='batch-results-page'
+        )
+    start = (page - 1) * _RESULTS_PAGE_SIZE
+    page_rows = results[start:start + _RESULTS_PAGE_SIZE]
+
+    # Result cards, painted into one placeholder with a single update
+    results_container = st.empty()
+    cards_html = "".join(_format_result_card(start + i, r, i) for i, r in enumerate(page_rows))
+    results_container.markdown(cards_html, unsafe_allow_html=True)
+
+    # Export (the CSV is only built once the user asks for it)
     st.markdown("<br>", unsafe_allow_html=True)
-    st.download_button(
-        "Download CSV Report",
-        csv,
-        "batch_results.csv",
-        "text/csv",
-        key='download-csv',
-        use_container_width=True
+    if st.button("Prepare CSV Report", use_container_width=True, key='prepare-csv'):
+        with st.spinner("Building report..."):
+            csv_bytes = _build_csv(tuple((r['Filename'], r['Score'], r['Status']) for r in results))
+        st.download_button(
+            "Download CSV Report",
+            csv_bytes,
+            "batch_results.csv",
+            "text/csv",
+            key='download-csv',
+            use_container_width=True
+        )
+
+
+@st.cache_data
+def _build_csv(rows):
+    """
+    Encode ranked (filename, score, status) rows as a CSV report.
+
+    Args:
+        rows: Tuple of (Filename, Score, Status) tuples in rank order
+
+    Returns:
+        UTF-8 encoded CSV bytes with a header row and scores to 4 decimals
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(['Filename', 'Score', 'Status'])
+    writer.writerows((filename, f"{score:.4f}", status) for filename, score, status in rows)
+    return buffer.getvalue().encode('utf-8')
+
+
+def _format_result_card(index, result, position=None):
+    """
+    Fill the result card template for one ranked row.
+
+    Args:
+        index: Zero-based rank in the full sorted list
+        result: Result row with Filename, Score and Status
+        position: Position on the current page, used to stagger the
+            entry animation (defaults to index)
+    """
+    score = result['Score']
+    status = result['Status']
+    is_error = status != 'Completed'
+
+    return _RESULT_CARD.format(
+        error_class=' is-error' if is_error else '',
+        delay=(index if position is None else position) * 0.05,
+        rank=index + 1,
+        filename=_esc(result['Filename']),
+        status=_esc(status),
+        status_color='#FF4757' if is_error else '#64748B',
+        color=get_score_hex(score),
+        score_pct=int(score * 100)
     )
@@ -3,22 +3,28 @@ Multi-Job Comparison Page
 Compare one resume against multiple job descriptions with ranked results.
 """
 import streamlit as st
-import tempfile
-import os
 import sys
+from html import escape as _esc
 from pathlib import Path
+from typing import Dict, Tuple
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from ui.styles import apply_global_styles, render_progress_bar, get_score_hex
+from ui.resources import get_pipeline
+from ui.styles import render_progress_bar, get_score_hex
+
+# (rank_icon, card_border) for the medal positions
+RANK_STYLE: Dict[int, Tuple[str, str]] = {
+    1: ('<span style="font-size: 24px;">&#129351;</span>', "rgba(0,229,153,0.3)"),
+    2: ('<span style="font-size: 24px;">&#129352;</span>', "rgba(192,192,192,0.3)"),
+    3: ('<span style="font-size: 24px;">&#129353;</span>', "rgba(205,127,50,0.3)"),
+}
 
 
 def render_multi_job_page():
     """Render the multi-job comparison page."""
 
-    apply_global_styles()
-
     # Header
     st.markdown("""
     <div class="page-header">
@@ -78,14 +84,10 @@ def render_multi_job_page():
     col1, col2 = st.columns(2)
     with col1:
         if st.session_state.job_count < 5:
-            if st.button("Add Position", use_container_width=True):
-                st.session_state.job_count += 1
-                st.rerun()
+            st.button("Add Position", use_container_width=True, on_click=_change_job_count, args=(1,))
     with col2:
         if st.session_state.job_count > 3:
-            if st.button("Remove Last", use_container_width=True):
-                st.session_state.job_count -= 1
-                st.rerun()
+            st.button("Remove Last", use_container_width=True, on_click=_change_job_count, args=(-1,))
 
     st.markdown("<br>", unsafe_allow_html=True)
 
@@ -104,22 +106,20 @@ def render_multi_job_page():
                     st.error(f"Error processing: {str(e)}")
 
 
+def _change_job_count(delta):
+    """Button callback: adjust the number of position slots before the rerun."""
+    st.session_state.job_count += delta
+
+
 def process_multi_job_comparison(uploaded_file, jobs):
     """Process the multi-job comparison."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-        tmp.write(uploaded_file.getbuffer())
-        tmp_path = tmp.name
-
-    try:
-        from pipeline.screening_pipeline import ScreeningPipeline
-        from src.matching.multi_job_matcher import compare_resume_to_jobs
+    from src.matching.multi_job_matcher import compare_resume_to_jobs
 
-        pipeline = ScreeningPipeline()
-        resume_data = pipeline.process_resume(tmp_path)
-        results = compare_resume_to_jobs(resume_data, jobs)
-        return results
-    finally:
-        os.unlink(tmp_path)
+    # Parsed straight from the upload; repeat runs on the same file hit the resume cache
+    pipeline = get_pipeline()
+    resume_data = pipeline.process_resume_bytes(uploaded_file.getvalue(), uploaded_file.name)
+    results = compare_resume_to_jobs(resume_data, jobs, pipeline=pipeline)
+    return results
 
 
 def display_comparison_results(results):
@@ -133,56 +133,11 @@ def display_comparison_results(results):
 
     job_results = results.get('results', [])
 
-    # Rank cards
-    for i, r in enumerate(job_results):
-        rank = r.get('rank', i + 1)
-        score = r.get('overall_score', 0)
-        score_pct = int(score * 100)
-        color = get_score_hex(score)
-        title = r.get('job_title', '')
-        company = r.get('job_company', '')
-        skill_match = r.get('subscores', {}).get('skill_match', 0)
-        skill_pct = int(skill_match * 100)
-
-        # Medal for top 3
-        if rank == 1:
-            rank_icon = '<span style="font-size: 24px;">&#129351;</span>'
-            card_border = "rgba(0,229,153,0.3)"
-        elif rank == 2:
-            rank_icon = '<span style="font-size: 24px;">&#129352;</span>'
-            card_border = "rgba(192,192,192,0.3)"
-        elif rank == 3:
-            rank_icon = '<span style="font-size: 24px;">&#129353;</span>'
-            card_border = "rgba(205,127,50,0.3)"
-        else:
-            rank_icon = f'<span style="font-family: JetBrains Mono; font-size: 18px; color: #64748B;">#{rank}</span>'
-            card_border = "var(--border)"
-
-        bar_html = render_progress_bar(score_pct, color, f"{0.3 + i * 0.15}s")
-
-        st.markdown(f"""
-        <div style="background: var(--surface); border: 1px solid {card_border};
-                    border-radius: 14px; padding: 20px 24px; margin-bottom: 12px;
-                    display: flex; align-items: center; gap: 20px;
-                    transition: all 0.2s ease; animation: fadeInUp 0.4s ease both;
-                    animation-delay: {i * 0.1}s;"
-             onmouseover="this.style.transform='translateY(-2px)'; this.style.boxShadow='0 8px 24px rgba(0,0,0,0.3)';"
-             onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='none';">
-
-            <div style="min-width: 48px; text-align: center;">{rank_icon}</div>
-
-            <div style="flex: 1;">
-                <div style="font-family: 'Sora'; font-weight: 600; font-size: 16px; color: #F1F5F9;">{title}</div>
-                <div style="font-size: 12px; color: #64748B; margin-top: 2px;">{company or ''}</div>
-                {bar_html}
-            </div>
-
-            <div style="text-align: right; min-width: 80px;">
-                <div style="font-family: 'JetBrains Mono'; font-size: 28px; font-weight: 700; color: {color};">{score_pct}%</div>
-                <div style="font-size: 11px; color: #64748B;">Skill: {skill_pct}%</div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    # Rank cards, emitted as one markdown block
+    st.markdown(
+        "".join(_format_rank_card(i, r) for i, r in enumerate(job_results)),
+        unsafe_allow_html=True
+    )
 
     # Detailed breakdown
     st.markdown("---")
@@ -200,19 +155,59 @@ def display_comparison_results(results):
             col1, col2 = st.columns(2)
 
             with col1:
-                st.markdown('<span class="section-label">Matched Skills</span>', unsafe_allow_html=True)
                 matched = r.get('matched_skills', [])
-                if matched:
-                    pills = ''.join([f'<span class="skill-pill skill-matched">{s}</span>' for s in matched])
-                    st.markdown(pills, unsafe_allow_html=True)
-                else:
-                    st.caption("None found")
+                pills = ''.join(f'<span class="skill-pill skill-matched">{_esc(s)}</span>' for s in matched)
+                st.markdown(
+                    '<span class="section-label">Matched Skills</span>'
+                    + (pills or '<p style="color: #64748B; font-size: 13px;">None found</p>'),
+                    unsafe_allow_html=True
+                )
 
             with col2:
-                st.markdown('<span class="section-label">Missing Skills</span>', unsafe_allow_html=True)
                 missing = r.get('missing_skills', [])
-                if missing:
-                    pills = ''.join([f'<span class="skill-pill skill-missing">{s.get("skill_name")}</span>' for s in missing[:5]])
-                    st.markdown(pills, unsafe_allow_html=True)
-                else:
-                    st.caption("None")
+                pills = ''.join(
+                    f'<span class="skill-pill skill-missing">{_esc(s.get("skill_name", ""))}</span>' for s in missing[:5]
+                )
+                st.markdown(
+                    '<span class="section-label">Missing Skills</span>'
+                    + (pills or '<p style="color: #64748B; font-size: 13px;">None</p>'),
+                    unsafe_allow_html=True
+                )
+
+
+def _format_rank_card(i, r):
+    """Build the ranking card markup for one compared job."""
+    rank = r.get('rank', i + 1)
+    score = r.get('overall_score', 0)
+    score_pct = int(score * 100)
+    color = get_score_hex(score)
+    title = r.get('job_title', '')
+    company = r.get('job_company', '')
+    skill_match = r.get('subscores', {}).get('skill_match', 0)
+    skill_pct = int(skill_match * 100)
+
+    # Medal for top 3
+    rank_icon, card_border = RANK_STYLE.get(rank) or (
+        f'<span style="font-family: JetBrains Mono; font-size: 18px; color: #64748B;">#{rank}</span>',
+        "var(--border)"
+    )
+
+    bar_html = render_progress_bar(score_pct, color, f"{0.3 + i * 0.15}s")
+
+    return f"""
+    <div class="rank-card" style="border-color: {card_border}; animation-delay: {i * 0.1}s;">
+
+        <div style="min-width: 48px; text-align: center;">{rank_icon}</div>
+
+        <div style="flex: 1;">
+            <div style="font-family: 'Sora'; font-weight: 600; font-size: 16px; color: #F1F5F9;">{_esc(title)}</div>
+            <div style="font-size: 12px; color: #64748B; margin-top: 2px;">{_esc(company or '')}</div>
+            {bar_html}
+        </div>
+
+        <div style="text-align: right; min-width: 80px;">
+            <div style="font-family: 'JetBrains Mono'; font-size: 28px; font-weight: 700; color: {color};">{score_pct}%</div>
+            <div style="font-size: 11px; color: #64748B;">Skill: {skill_pct}%</div>
+        </div>
+    </div>
+    """
@@ -0,0 +1,19 @@
+"""
+Shared UI Resources
+Heavy objects cached once per Streamlit process and shared by all pages.
+"""
+import streamlit as st
+
+
+@st.cache_resource
+def get_pipeline():
+    """
+    Build the screening pipeline once per process and reuse it across reruns and pages.
+
+    cache_resource shares the instance between all sessions, whose script
+    runs execute on separate threads. That is safe because ScreeningPipeline
+    only sets attributes in __init__; per-request state lives in locals and
+    the returned objects.
+    """
+    from pipeline.screening_pipeline import ScreeningPipeline
+    return ScreeningPipeline()
@@ -2,11 +2,10 @@
 Streamlit Web Interface for Smart Resume Coach
 Premium Dark Theme with Animations
 """
+import hashlib
 import streamlit as st
-import tempfile
-import os
-import time
 import sys
+from html import escape as _esc
 from pathlib import Path
 
 # Add project root to path
@@ -19,7 +18,14 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Skill pill markup; kind is 'matched' or 'missing'
+_SKILL_PILL = '<span class="skill-pill skill-{kind}" style="animation-delay: {delay}s;">{name}</span>'
+
+# Screening results remembered per session, keyed by file and job
+_SCREENING_CACHE_SIZE = 8
+
 # Apply global styles
+from ui.resources import get_pipeline
 from ui.styles import apply_global_styles, render_score_ring, render_progress_bar, get_score_hex
 apply_global_styles()
 
@@ -49,7 +55,7 @@ def main():
 
         page = st.radio(
             "nav",
-            ["Resume Analyzer", "Multi-Job Comparison", "Batch Processing"],
+            list(PAGE_RENDERERS),
             index=0,
             label_visibility="collapsed"
         )
@@ -69,13 +75,8 @@ def main():
         </div>
         """, unsafe_allow_html=True)
 
-    # Route
-    if page == "Resume Analyzer":
-        render_single_job_page()
-    elif page == "Multi-Job Comparison":
-        render_multi_job_page()
-    elif page == "Batch Processing":
-        render_batch_processing_page()
+    # Route (page modules and the pipeline are only imported by the chosen renderer)
+    PAGE_RENDERERS[page]()
 
 
 def render_single_job_page():
@@ -141,14 +142,15 @@ def render_single_job_page():
         elif len(job_description.strip()) < 30:
             st.error("Job description is too short. Please provide at least 30 characters.")
         else:
-            with st.spinner("Analyzing match..."):
+            # Each pipeline stage is reported as it finishes
+            with st.status("Analyzing match...", expanded=True) as status:
                 try:
-                    # Simulate slight delay for effect
-                    time.sleep(0.5)
-                    result = process_screening(uploaded_file, job_title, job_description)
+                    result = process_screening(uploaded_file, job_title, job_description, status)
                     st.session_state['last_result'] = result
                     st.session_state['last_analyzed_file'] = uploaded_file.name
+                    status.update(label="Analysis complete", state="complete", expanded=False)
                 except Exception as e:
+                    status.update(label="Analysis failed", state="error")
                     st.error(f"Analysis Failed: {str(e)}")
                     st.session_state.pop('last_result', None)
     
@@ -172,27 +174,71 @@ def render_batch_processing_page():
     bpp()
 
 
-def process_screening(uploaded_file, job_title: str, job_description: str):
-    """Process the screening request with error handling."""
+PAGE_RENDERERS = {
+    "Resume Analyzer": render_single_job_page,
+    "Multi-Job Comparison": render_multi_job_page,
+    "Batch Processing": render_batch_processing_page,
+}
+
+
+def process_screening(uploaded_file, job_title: str, job_description: str, status=None):
+    """Process the screening request with error handling, reporting stages to an optional st.status."""
     # Validate file size (5 MB limit)
     if uploaded_file.size > 5 * 1024 * 1024:
         raise ValueError(f"File too large ({uploaded_file.size / (1024*1024):.1f} MB). Maximum is 5 MB.")
     
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-        tmp.write(uploaded_file.getbuffer())
-        tmp_path = tmp.name
-    
+    data = uploaded_file.getvalue()
+    job_title = job_title or "Job Position"
+
+    # Re-running the same file against the same job reuses this session's result
+    key = _screening_key(data, job_title, job_description)
+    cached = st.session_state.setdefault('_screening_results', {})
+    if key in cached:
+        if status is not None:
+            status.write("Reused the result from an identical earlier analysis")
+        return cached[key]
+
     try:
-        from pipeline.screening_pipeline import ScreeningPipeline
-        
-        pipeline = ScreeningPipeline()
-        result = pipeline.screen_resume(tmp_path, job_description, job_title or "Job Position")
-        return result
+        # Screened straight from the upload's bytes, no temp file
+        pipeline = get_pipeline()
+        stages = pipeline.screen_resume_bytes_streaming(
+            data,
+            job_description,
+            job_title,
+            filename=uploaded_file.name
+        )
+        for stage, payload in stages:
+            if status is not None:
+                status.write(_describe_stage(stage, payload))
+        result = payload
     except Exception as e:
         raise RuntimeError(f"Pipeline error: {str(e)}")
-    finally:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+
+    # Keep only the most recent results so a long session stays small
+    if len(cached) >= _SCREENING_CACHE_SIZE:
+        cached.pop(next(iter(cached)))
+    cached[key] = result
+    return result
+
+
+def _describe_stage(stage: str, payload) -> str:
+    """One-line progress message for a finished screening stage."""
+    if stage == 'resume':
+        return f"✓ Parsed resume: {len(payload.skills)} skills found"
+    if stage == 'job':
+        return f"✓ Processed job description: {len(payload.required_skills)} skills required"
+    return f"✓ Scored match: {int(payload['match'].get('overall_score', 0) * 100)}%"
+
+
+def _screening_key(data: bytes, job_title: str, job_description: str) -> str:
+    """Fingerprint of one screening request's inputs."""
+    hasher = hashlib.blake2b(data, digest_size=16)
+    for part in (job_title, job_description):
+        # Length-prefixed so different splits of the same text never collide
+        encoded = part.encode('utf-8')
+        hasher.update(len(encoded).to_bytes(8, 'little'))
+        hasher.update(encoded)
+    return hasher.hexdigest()
 
 
 def display_results(result: dict):
@@ -308,10 +354,10 @@ def display_results(result: dict):
         st.markdown('<span class="section-label">Matched Skills</span>', unsafe_allow_html=True)
         matched = match.get('matched_skills', [])
         if matched:
-            pills_html = ''.join([
-                f'<span class="skill-pill skill-matched" style="animation-delay: {i*0.05}s;">{skill}</span>'
+            pills_html = ''.join(
+                _SKILL_PILL.format(kind='matched', delay=i * 0.05, name=_esc(skill))
                 for i, skill in enumerate(matched)
-            ])
+            )
             st.markdown(f'<div style="animation: fadeInUp 0.4s ease both;">{pills_html}</div>', unsafe_allow_html=True)
         else:
             st.info("No matching skills found.")
@@ -320,10 +366,10 @@ def display_results(result: dict):
         st.markdown('<span class="section-label">Missing Skills</span>', unsafe_allow_html=True)
         missing = match.get('missing_skills', [])
         if missing:
-            pills_html = ''.join([
-                f'<span class="skill-pill skill-missing" style="animation-delay: {i*0.05}s;">{s["skill_name"]}</span>'
+            pills_html = ''.join(
+                _SKILL_PILL.format(kind='missing', delay=i * 0.05, name=_esc(s["skill_name"]))
                 for i, s in enumerate(missing[:10])
-            ])
+            )
             st.markdown(f'<div style="animation: fadeInUp 0.4s ease both; animation-delay: 0.2s;">{pills_html}</div>', unsafe_allow_html=True)
         else:
             st.success("No missing critical or preferred skills!")
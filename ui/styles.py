@@ -2,12 +2,13 @@
 Global CSS Styles for Smart Resume Coach
 Premium dark theme with animations, glassmorphism, and micro-interactions
 """
+import functools
+import re
+
 import streamlit as st
 
 
-def apply_global_styles():
-    """Inject production-grade CSS into Streamlit."""
-    st.markdown("""
+_GLOBAL_CSS = """
     <style>
         /* =====================================================================
            FONTS
@@ -199,6 +200,83 @@ def apply_global_styles():
             box-shadow: var(--shadow-md);
         }
 
+        .result-card {
+            background: var(--surface);
+            border: 1px solid var(--border);
+            border-radius: 12px;
+            padding: 16px 20px;
+            margin-bottom: 8px;
+            display: flex;
+            align-items: center;
+            justify-content: space-between;
+            transition: all 0.15s ease;
+            animation: fadeInUp 0.3s ease both;
+        }
+
+        .result-card.is-error {
+            border-color: rgba(255, 71, 87, 0.2);
+        }
+
+        .result-card:hover {
+            border-color: var(--border-hover);
+            transform: translateY(-1px);
+        }
+
+        .course-card {
+            background: rgba(255, 255, 255, 0.02);
+            border: 1px solid var(--border);
+            border-radius: 12px;
+            padding: 18px 20px;
+            margin-bottom: 10px;
+            transition: all 0.2s ease;
+            animation: fadeInUp 0.3s ease both;
+        }
+
+        .course-card:hover {
+            border-color: var(--border-hover);
+            transform: translateY(-1px);
+            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
+        }
+
+        .rank-card {
+            background: var(--surface);
+            border: 1px solid var(--border);
+            border-radius: 14px;
+            padding: 20px 24px;
+            margin-bottom: 12px;
+            display: flex;
+            align-items: center;
+            gap: 20px;
+            transition: all 0.2s ease;
+            animation: fadeInUp 0.4s ease both;
+        }
+
+        .rank-card:hover {
+            transform: translateY(-2px);
+            box-shadow: 0 8px 24px rgba(0, 0, 0, 0.3);
+        }
+
+        .course-link {
+            display: block;
+            text-align: center;
+            margin-top: 14px;
+            background: rgba(0, 217, 255, 0.08);
+            color: #00D9FF;
+            text-decoration: none;
+            padding: 10px;
+            border-radius: 8px;
+            font-weight: 600;
+            font-size: 13px;
+            font-family: 'Sora';
+            border: 1px solid rgba(0, 217, 255, 0.15);
+            transition: all 0.2s ease;
+        }
+
+        .course-link:hover {
+            background: rgba(0, 217, 255, 0.15);
+            border-color: rgba(0, 217, 255, 0.3);
+        }
+
         /* =====================================================================
            HERO SCORE
            ===================================================================== */
@@ -520,9 +598,27 @@ def apply_global_styles():
         }
 
     </style>
-    """, unsafe_allow_html=True)
+"""
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE = re.compile(r"\s+")
+_CSS_PUNCT_SPACE = re.compile(r"\s*([{};])\s*")
+
+
+@functools.lru_cache(maxsize=1)
+def _global_css() -> str:
+    """Global stylesheet with comments and indentation stripped, built once per process."""
+    css = _CSS_COMMENT.sub("", _GLOBAL_CSS)
+    css = _CSS_SPACE.sub(" ", css)
+    return _CSS_PUNCT_SPACE.sub(r"\1", css).strip()
+
+
+def apply_global_styles():
+    """Inject production-grade CSS into Streamlit."""
+    st.markdown(_global_css(), unsafe_allow_html=True)
 
 
+@functools.lru_cache(maxsize=512)
 def render_score_ring(score_pct: int, color: str, size: int = 180, stroke: int = 10):
     """Generate SVG circular score ring HTML."""
     radius = (size - stroke) / 2